@@ -11,11 +11,13 @@ from sidecar.audio.preprocessing import preprocess_audio
 from sidecar.domain.exceptions import TranscriptionError
 from sidecar.domain.transcript_processor import merge_transcripts
 from sidecar.domain.types import Transcript
-from sidecar.shared.utils import is_oom_error
+from sidecar.shared.utils import get_env, is_oom_error
 from sidecar.stt.engine_manager import MAX_OOM_RETRIES, STTEngineManager
 
 logger = logging.getLogger(__name__)
 
+INT16_SCALE = np.float32(1.0 / 32768.0)
+
 
 class TranscriptionService:
     def __init__(
@@ -24,14 +26,31 @@ class TranscriptionService:
         executor: ThreadPoolExecutor | None = None,
     ) -> None:
         self._engine_manager = engine_manager
+        # Own a dedicated pool rather than falling back to the loop's default
+        # executor, which is shared with every other run_in_executor call in
+        # the process and would queue STT work behind unrelated I/O.
+        self._owns_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=get_env("STT_WORKERS", 4), thread_name_prefix="stt"
+            )
         self._executor = executor
 
+    def close(self) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
     def _transcribe_sync(
         self,
-        audio: NDArray[np.float32],
+        audio: NDArray[np.float32] | NDArray[np.int16],
         language: str | None = None,
         word_timestamps: bool = False,
     ) -> Transcript:
+        # int16 chunks stay packed until this point so only half the bytes
+        # travel through the chunk list and executor queue; upcast here,
+        # in the worker thread, right before the engine call.
+        if audio.dtype == np.int16:
+            audio = audio.astype(np.float32) * INT16_SCALE
         last_error: Exception | None = None
         for attempt in range(MAX_OOM_RETRIES):
             try:
@@ -79,7 +98,7 @@ class TranscriptionService:
         language: str | None = None,
         word_timestamps: bool = False,
     ) -> Transcript:
-        chunks = preprocess_audio(data, fmt)
+        chunks = preprocess_audio(data, fmt, dtype=np.int16)
         total_duration_ms = sum(c.duration_ms for c in chunks)
         logger.info(f"Transcribing encoded audio: {total_duration_ms}ms ({len(chunks)} chunk(s))")
 
@@ -112,7 +131,7 @@ class TranscriptionService:
         language: str | None = None,
         word_timestamps: bool = False,
     ) -> Transcript:
-        chunks = preprocess_audio(data, fmt)
+        chunks = preprocess_audio(data, fmt, dtype=np.int16)
         total_duration_ms = sum(c.duration_ms for c in chunks)
         logger.info(f"Transcribing encoded audio: {total_duration_ms}ms ({len(chunks)} chunk(s))")
 
@@ -1,4 +1,5 @@
 from sidecar.audio.codecs import (
+    StreamingResampler,
     decode_encoded_audio,
     pcm16_to_float32,
     resample_audio,
@@ -20,6 +21,7 @@ __all__ = [
     "decode_encoded_audio",
     "pcm16_to_float32",
     "resample_audio",
+    "StreamingResampler",
     "AudioChunk",
     "decode_audio",
     "chunk_audio",
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 import io
 import logging
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 
 import numpy as np
@@ -15,7 +19,7 @@ TARGET_CHANNELS = 1
 CHUNK_DURATION_MS = 5 * 60 * 1000
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AudioChunk:
     data: np.ndarray
     sample_rate: int
@@ -23,16 +27,27 @@ class AudioChunk:
     offset_ms: int
 
 
+_EXT_TO_FORMAT = {
+    "mp3": "mp3",
+    "wav": "wav",
+    "ogg": "ogg",
+    "flac": "flac",
+    "aac": "aac",
+    "opus": "opus",
+    "webm": "webm",
+    "m4a": "mp4",
+}
+
+
 def _detect_format(filename: str | None) -> str | None:
     if not filename:
         return None
-    ext = filename.rsplit(".", 1)[-1].lower()
-    if ext == "m4a":
-        return "mp4"
-    return ext if ext in ("mp3", "wav", "ogg", "flac", "aac", "opus", "webm") else None
+    return _EXT_TO_FORMAT.get(filename.rpartition(".")[2].lower())
 
 
-def decode_audio(audio_bytes: bytes, source_format: str | None = None) -> np.ndarray:
+def decode_audio(
+    audio_bytes: bytes, source_format: str | None = None, dtype: type = np.float32
+) -> np.ndarray:
     buffer = io.BytesIO(audio_bytes)
     try:
         if source_format:
@@ -45,8 +60,15 @@ def decode_audio(audio_bytes: bytes, source_format: str | None = None) -> np.nda
         raise ValueError(f"Failed to process audio: {e}") from e
 
     audio = audio.set_frame_rate(TARGET_SAMPLE_RATE).set_channels(TARGET_CHANNELS)
-    samples = np.array(audio.get_array_of_samples(), dtype=np.int16)
-    return samples.astype(np.float32) / 32768.0
+    # View the decoded PCM in place rather than copying it through
+    # get_array_of_samples; the float conversion is a single fused pass
+    # into one preallocated output instead of astype + divide temporaries.
+    samples = np.frombuffer(audio.raw_data, dtype=np.int16)
+    if dtype == np.int16:
+        return samples
+    out = np.empty(samples.shape[0], dtype=np.float32)
+    np.multiply(samples, np.float32(1.0 / 32768.0), out=out)
+    return out
 
 
 def chunk_audio(
@@ -73,6 +95,8 @@ def chunk_audio(
 
     while offset_samples < total_samples:
         end_samples = min(offset_samples + chunk_samples, total_samples)
+        # Basic slicing yields a view over the decoded buffer, so chunking
+        # never copies sample data regardless of audio length.
         segment = audio[offset_samples:end_samples]
         segment_duration_ms = int(len(segment) / sample_rate * 1000)
         offset_ms = int(offset_samples / sample_rate * 1000)
@@ -91,9 +115,43 @@ def chunk_audio(
     return chunks
 
 
-def preprocess_audio(audio_bytes: bytes, filename: str | None = None) -> list[AudioChunk]:
+# Repeat uploads (client retries, re-runs after an engine fallback) carry the
+# exact same bytes; memoizing by content hash skips decode+chunk entirely.
+# Cached chunks are frozen wrappers over views nothing mutates, so sharing is
+# safe. Set PREPROCESS_CACHE_SIZE=0 to disable on memory-constrained hosts.
+_CACHE_SIZE = int(os.environ.get("PREPROCESS_CACHE_SIZE", "8"))
+_chunk_cache: OrderedDict[tuple[bytes, str | None, str], list[AudioChunk]] = OrderedDict()
+_chunk_cache_lock = threading.Lock()
+
+
+def clear_preprocess_cache() -> None:
+    with _chunk_cache_lock:
+        _chunk_cache.clear()
+
+
+def preprocess_audio(
+    audio_bytes: bytes, filename: str | None = None, dtype: type = np.float32
+) -> list[AudioChunk]:
     source_format = _detect_format(filename)
-    audio = decode_audio(audio_bytes, source_format)
+
+    key = None
+    if _CACHE_SIZE > 0:
+        digest = hashlib.blake2b(audio_bytes, digest_size=16).digest()
+        key = (digest, source_format, np.dtype(dtype).name)
+        with _chunk_cache_lock:
+            cached = _chunk_cache.get(key)
+            if cached is not None:
+                _chunk_cache.move_to_end(key)
+                return cached
+
+    audio = decode_audio(audio_bytes, source_format, dtype=dtype)
     duration_s = len(audio) / TARGET_SAMPLE_RATE
     logger.info(f"Audio duration: {duration_s:.1f}s, converted to {TARGET_SAMPLE_RATE}Hz mono")
-    return chunk_audio(audio)
+    chunks = chunk_audio(audio)
+
+    if key is not None:
+        with _chunk_cache_lock:
+            _chunk_cache[key] = chunks
+            while len(_chunk_cache) > _CACHE_SIZE:
+                _chunk_cache.popitem(last=False)
+    return chunks
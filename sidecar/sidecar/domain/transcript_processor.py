@@ -4,13 +4,18 @@ from sidecar.domain.types import Transcript
 
 
 def deduplicate_words(text: str, confirmed_words: list[str]) -> tuple[str, list[str]]:
-    words = [w for w in text.strip().split() if w]
+    words = text.split()
     overlap = 0
     max_overlap = min(len(words), len(confirmed_words))
-    for i in range(max_overlap, 0, -1):
-        if [w.lower() for w in confirmed_words[-i:]] == [w.lower() for w in words[:i]]:
-            overlap = i
-            break
+    if max_overlap:
+        # Lowercase each side once up front; the candidate loop then only
+        # compares precomputed lists instead of re-lowercasing per length.
+        tail_lower = [w.lower() for w in confirmed_words[-max_overlap:]]
+        words_lower = [w.lower() for w in words[:max_overlap]]
+        for i in range(max_overlap, 0, -1):
+            if tail_lower[max_overlap - i :] == words_lower[:i]:
+                overlap = i
+                break
     new_words = words[overlap:]
     if new_words:
         confirmed_words.extend(new_words)
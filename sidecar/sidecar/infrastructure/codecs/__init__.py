@@ -1,7 +1,8 @@
 from sidecar.infrastructure.codecs.audio_codec import (
+    StreamingResampler,
     decode_encoded_audio,
     pcm16_to_float32,
     resample_audio,
 )
 
-__all__ = ["decode_encoded_audio", "pcm16_to_float32", "resample_audio"]
+__all__ = ["decode_encoded_audio", "pcm16_to_float32", "resample_audio", "StreamingResampler"]
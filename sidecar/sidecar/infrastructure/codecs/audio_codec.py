@@ -10,17 +10,66 @@ from numpy.typing import NDArray
 from sidecar.domain.constants import TARGET_SAMPLE_RATE
 from sidecar.domain.exceptions import TranscriptionError
 
+# Containers libsndfile cannot open; trying soundfile first for these only
+# adds a failed parse before the inevitable ffmpeg fallback.
+_SOUNDFILE_UNSUPPORTED = {"webm", "m4a", "mp4", "aac"}
 
-def decode_encoded_audio(data: bytes, fmt: str | None = None) -> bytes:
-    try:
-        import soundfile as sf
 
-        audio_data, sr = sf.read(BytesIO(data), dtype="int16", format=fmt or None)
-        if sr != TARGET_SAMPLE_RATE:
-            audio_data = soxr.resample(audio_data.astype(np.float32), sr, TARGET_SAMPLE_RATE).astype(np.int16)
-        return audio_data.tobytes()
+def _decode_with_pyav(data: bytes) -> bytes | None:
+    """Decode in-process via libav when PyAV is installed.
+
+    Skips the fork/exec and pipe traffic of an ffmpeg subprocess; the
+    resampler mixes down and converts to 16 kHz s16 inside libswresample.
+    Returns None when PyAV is missing or the container can't be decoded,
+    so callers fall through to the subprocess path.
+    """
+    try:
+        import av
+    except ImportError:
+        return None
+    try:
+        resampler = av.AudioResampler(format="s16", layout="mono", rate=TARGET_SAMPLE_RATE)
+        pieces: list[bytes] = []
+        with av.open(BytesIO(data)) as container:
+            for frame in container.decode(audio=0):
+                for out in resampler.resample(frame):
+                    pieces.append(out.to_ndarray().tobytes())
+            for out in resampler.resample(None):
+                pieces.append(out.to_ndarray().tobytes())
+        if not pieces:
+            return None
+        return b"".join(pieces)
     except Exception:
-        pass
+        return None
+
+
+def decode_encoded_audio(data: bytes, fmt: str | None = None) -> bytes:
+    if fmt not in _SOUNDFILE_UNSUPPORTED:
+        try:
+            import soundfile as sf
+
+            # soundfile only accepts an explicit format for RAW input and
+            # raises for anything else, which silently sent every decode
+            # with a format hint to ffmpeg; let libsndfile sniff the header.
+            audio_data, sr = sf.read(BytesIO(data), dtype="int16")
+            if audio_data.ndim == 2:
+                # Mix down before resampling so soxr touches half the
+                # samples. Accumulating in int32 inside sum avoids both
+                # overflow and a full-size cast copy of the stereo buffer;
+                # the divide runs in place on the mono sums.
+                mono = audio_data.sum(axis=1, dtype=np.int32)
+                mono //= audio_data.shape[1]
+                audio_data = mono.astype(np.int16)
+            if sr != TARGET_SAMPLE_RATE:
+                # soxr resamples int16 natively, so no float32 round-trip is needed.
+                audio_data = soxr.resample(audio_data, sr, TARGET_SAMPLE_RATE)
+            return audio_data.tobytes()
+        except Exception:
+            pass
+
+    decoded = _decode_with_pyav(data)
+    if decoded is not None:
+        return decoded
 
     cmd = [
         "ffmpeg",
@@ -50,10 +99,39 @@ def decode_encoded_audio(data: bytes, fmt: str | None = None) -> bytes:
 
 def pcm16_to_float32(pcm_bytes: bytes) -> NDArray[np.float32]:
     pcm_array = np.frombuffer(pcm_bytes, dtype=np.int16)
-    return pcm_array.astype(np.float32) / 32768.0
+    # One fused multiply by the exact float32 reciprocal of 32768 writes
+    # straight into the output, instead of astype + divide temporaries.
+    out = np.empty(pcm_array.shape[0], dtype=np.float32)
+    np.multiply(pcm_array, np.float32(1.0 / 32768.0), out=out)
+    return out
 
 
 def resample_audio(audio: NDArray[np.float32], source_rate: int, target_rate: int) -> NDArray[np.float32]:
     if source_rate == target_rate:
         return audio
-    return soxr.resample(audio, source_rate, target_rate).astype(np.float32)
+    # soxr preserves the input dtype; astype here would copy the whole buffer.
+    return soxr.resample(audio, source_rate, target_rate)
+
+
+class StreamingResampler:
+    """Carries soxr filter state across the chunks of one audio stream.
+
+    One-shot soxr.resample rebuilds its filter for every 20 ms message and
+    treats each chunk as an isolated signal, ringing at the seams. A
+    per-session ResampleStream pays the setup once and produces seamless
+    output across chunk boundaries, the same approach the TTS opus encoder
+    uses. Instances hold filter state, so they must not be shared between
+    sessions.
+    """
+
+    def __init__(self, source_rate: int, target_rate: int) -> None:
+        self.source_rate = source_rate
+        self.target_rate = target_rate
+        self._stream: soxr.ResampleStream | None = None
+        if source_rate != target_rate:
+            self._stream = soxr.ResampleStream(source_rate, target_rate, 1, dtype="float32")
+
+    def process(self, audio: NDArray[np.float32]) -> NDArray[np.float32]:
+        if self._stream is None:
+            return audio
+        return self._stream.resample_chunk(audio)
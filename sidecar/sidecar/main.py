@@ -52,6 +52,7 @@ vad_config = VADConfig(
     min_speech_duration_ms=get_env("VAD_MIN_SPEECH_MS", 250),
     min_audio_duration_ms=get_env("VAD_MIN_AUDIO_MS", 300),
     max_utterance_ms=get_env("VAD_MAX_UTTERANCE_MS", 15000),
+    energy_floor=get_env("VAD_ENERGY_FLOOR", 0.01),
 )
 
 eou_config = EOUConfig(
@@ -118,6 +119,8 @@ def _preload_models() -> None:
     if preload_stt:
         logger.info("Preloading STT model...")
         engine_manager.preload()
+        if get_env("PREWARM_STT_CPU_FALLBACK", True):
+            engine_manager.prewarm_fallback()
 
 
 async def serve() -> None:
@@ -149,11 +152,19 @@ async def serve() -> None:
         interceptors.append(token_auth_interceptor(token))
 
     max_msg_size = get_env("GRPC_MAX_MESSAGE_SIZE", 512) * 1024 * 1024
+    # Cap in-flight RPCs near what the worker pools can actually service so
+    # bursts queue in gRPC instead of saturating the executors.
+    max_concurrent_rpcs = get_env("GRPC_MAX_CONCURRENT_RPCS", (stt_workers + tts_workers) * 4)
     server = grpc_aio.server(
         interceptors=interceptors,
+        maximum_concurrent_rpcs=max_concurrent_rpcs if max_concurrent_rpcs > 0 else None,
         options=[
             ('grpc.max_send_message_length', max_msg_size),
             ('grpc.max_receive_message_length', max_msg_size),
+            # Service unary-stream responses on one thread to cut context
+            # switches; stream-stream RPCs (Transcribe/Synthesize) are
+            # unaffected but the option is harmless for them.
+            ('grpc.experimental.single_threaded_unary_stream', 1),
         ],
     )
     stt_pb2_grpc.add_TranscriptionServiceServicer_to_server(
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
+import hmac
 import os
 import re
+import sys
 import threading
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import TypeVar, overload
@@ -10,13 +13,24 @@ T = TypeVar("T", int, float, bool, str)
 
 MAX_CHUNK_CHARS = 250
 
+# Compiled once at import: chunk_text runs on every synthesis request. The
+# fixed-width lookbehind plus \s+ scans in one linear pass, no backtracking.
+# CJK full-width terminators are included for the ja/cmn voices.
+_SENTENCE_PATTERN = re.compile(r'(?<=[.!?。！？])\s+')
+
 
 def chunk_text(text: str, max_chars: int = MAX_CHUNK_CHARS) -> list[str]:
+    # The cached helper returns a tuple (hashable, safely shared); callers
+    # get a fresh list so mutating the result can't poison the cache.
+    return list(_chunk_text_cached(text, max_chars))
+
+
+@functools.lru_cache(maxsize=128)
+def _chunk_text_cached(text: str, max_chars: int) -> tuple[str, ...]:
     if len(text) <= max_chars:
-        return [text]
+        return (text,)
 
-    sentence_pattern = re.compile(r'(?<=[.!?])\s+')
-    sentences = sentence_pattern.split(text)
+    sentences = _SENTENCE_PATTERN.split(text)
 
     chunks: list[str] = []
     current = ""
@@ -46,7 +60,7 @@ def chunk_text(text: str, max_chars: int = MAX_CHUNK_CHARS) -> list[str]:
     if current:
         chunks.append(current)
 
-    return chunks if chunks else [text]
+    return tuple(chunks) if chunks else (text,)
 
 
 @overload
@@ -73,23 +87,41 @@ def get_env(key: str, default: T) -> T:
     return value  # type: ignore[return-value]
 
 
+# Module constant so the scan list isn't rebuilt per call; the CUDA
+# variants ("cuda out of memory", "cuda error: out of memory") are already
+# covered by the plain "out of memory" substring.
+_OOM_KEYWORDS = (
+    "out of memory",
+    "oom",
+    "cublas alloc",
+    "alloc_failed",
+    "failed to allocate",
+    "memory allocation",
+)
+
+
 def is_oom_error(error: Exception) -> bool:
+    # Torch raises a dedicated class since 1.13; checking it first avoids
+    # the string scan on the common CUDA case and can't false-positive on
+    # unrelated errors that merely mention memory. torch is resolved from
+    # sys.modules only — if it was never imported, the error can't be a
+    # torch OOM anyway.
+    torch = sys.modules.get("torch")
+    if torch is not None and isinstance(error, torch.cuda.OutOfMemoryError):
+        return True
+
+    # String fallback for non-torch backends (ONNX Runtime, cuBLAS).
     err_str = str(error).lower()
-    return any(keyword in err_str for keyword in [
-        "out of memory",
-        "oom",
-        "cuda out of memory",
-        "cuda error: out of memory",
-        "cublas alloc",
-        "alloc_failed",
-        "failed to allocate",
-        "memory allocation",
-    ])
+    return any(keyword in err_str for keyword in _OOM_KEYWORDS)
 
 
 def token_auth_interceptor(expected_token: str) -> grpc.ServerInterceptor:
     import grpc
 
+    # Encoded once at factory time; hmac.compare_digest gives constant-time
+    # equality so token checks don't leak match length through timing.
+    expected = expected_token.encode()
+
     class AuthInterceptor(grpc.ServerInterceptor):
         def intercept_service(self, continuation, handler_call_details):
             meta = dict(handler_call_details.invocation_metadata or [])
@@ -100,7 +132,7 @@ def token_auth_interceptor(expected_token: str) -> grpc.ServerInterceptor:
                 return grpc.unary_unary_rpc_method_handler(deny)
 
             token = auth_header.split(" ", 1)[1].strip()
-            if token != expected_token:
+            if not hmac.compare_digest(token.encode(), expected):
                 def deny(request, context):  # noqa: ANN001
                     context.abort(grpc.StatusCode.UNAUTHENTICATED, "invalid token")
                 return grpc.unary_unary_rpc_method_handler(deny)
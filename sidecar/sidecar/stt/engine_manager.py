@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import gc
+import heapq
+import itertools
 import logging
 import threading
 import time
@@ -19,14 +21,23 @@ T = TypeVar("T")
 MAX_OOM_RETRIES = 3
 
 
+# CUDA presence is immutable for the process; probe once instead of asking
+# the driver on every cache clear (OOM-retry loops call this repeatedly).
+_cuda_ok: bool | None = None
+
+
 def _clear_cuda_cache() -> None:
-    try:
+    global _cuda_ok
+    if _cuda_ok is None:
+        try:
+            import torch
+            _cuda_ok = torch.cuda.is_available()
+        except ImportError:
+            _cuda_ok = False
+    if _cuda_ok:
         import torch
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
-            torch.cuda.synchronize()
-    except ImportError:
-        pass
+        torch.cuda.empty_cache()
+        torch.cuda.synchronize()
     gc.collect()
 
 
@@ -36,6 +47,55 @@ class EngineConfig:
     device: str = "cuda"
     ttl: int = 300
     fallback_models: list[str] = field(default_factory=list)
+    preload_fallbacks: bool = False
+
+
+class _TtlScheduler:
+    """Fires engine TTL expirations from a single daemon thread.
+
+    threading.Timer spawns one OS thread per scheduled unload, so every
+    ref-drop under bursty traffic pays thread creation and teardown. All
+    deadlines instead go into one min-heap drained by a shared thread;
+    scheduling is a heap push and cancellation is handled by the caller
+    ignoring stale expirations (lazy deletion), so nothing is ever removed
+    from the heap early.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, Callable[[], None]]] = []
+        self._tiebreak = itertools.count()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, deadline: float, fire: Callable[[], None]) -> None:
+        with self._lock:
+            heapq.heappush(self._heap, (deadline, next(self._tiebreak), fire))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="stt-ttl-scheduler", daemon=True
+                )
+                self._thread.start()
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                due: list[Callable[[], None]] = []
+                while self._heap and self._heap[0][0] <= now:
+                    due.append(heapq.heappop(self._heap)[2])
+                timeout = self._heap[0][0] - now if self._heap else None
+            for fire in due:
+                try:
+                    fire()
+                except Exception:
+                    logger.exception("TTL expiration callback failed")
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+
+_ttl_scheduler = _TtlScheduler()
 
 
 class ManagedEngine(Generic[T]):
@@ -52,7 +112,7 @@ class ManagedEngine(Generic[T]):
         self.engine_removed_callback = engine_removed_callback
         self.ref_count: int = 0
         self.rlock = threading.RLock()
-        self.expire_timer: threading.Timer | None = None
+        self._ttl_generation: int = 0
         self.engine: T | None = None
 
     def unload(self) -> None:
@@ -61,8 +121,6 @@ class ManagedEngine(Generic[T]):
                 return
             if self.ref_count > 0:
                 return
-            if self.expire_timer:
-                self.expire_timer.cancel()
             if isinstance(self.engine, STTEngineLifecycle):
                 self.engine.unload()
             self.engine = None
@@ -85,17 +143,26 @@ class ManagedEngine(Generic[T]):
     def _increment_ref(self) -> None:
         with self.rlock:
             self.ref_count += 1
-            if self.expire_timer:
-                self.expire_timer.cancel()
-                self.expire_timer = None
+            # Invalidate any pending expiration instead of cancelling it.
+            self._ttl_generation += 1
 
     def _decrement_ref(self) -> None:
         with self.rlock:
             self.ref_count -= 1
             if self.ref_count <= 0 and self.ttl > 0:
                 logger.info(f"Engine {self.engine_id} idle, unloading in {self.ttl}s")
-                self.expire_timer = threading.Timer(self.ttl, self.unload)
-                self.expire_timer.start()
+                self._ttl_generation += 1
+                generation = self._ttl_generation
+                _ttl_scheduler.submit(
+                    time.monotonic() + self.ttl,
+                    lambda: self._ttl_expired(generation),
+                )
+
+    def _ttl_expired(self, generation: int) -> None:
+        with self.rlock:
+            if generation != self._ttl_generation:
+                return
+            self.unload()
 
     def __enter__(self) -> T:
         with self.rlock:
@@ -118,6 +185,9 @@ class STTEngineManager:
         self._current_device = config.device
         self._failed_models: set[str] = set()
         self._tried_cpu_fallback: bool = False
+        self._prewarmed_cpu_engine: STTEngine | None = None
+        self._prewarm_thread: threading.Thread | None = None
+        self._cpu_warm = threading.Event()
 
     def _handle_engine_removed(self, engine_id: str) -> None:
         with self._lock:
@@ -127,9 +197,50 @@ class STTEngineManager:
     def _create_engine(self, model_id: str) -> STTEngine:
         from sidecar.stt.engines import ParakeetConfig, ParakeetEngine
 
+        if self._current_device == "cpu" and model_id == self.config.model_id:
+            engine = self._take_prewarmed_cpu_engine()
+            if engine is not None:
+                logger.info("Using prewarmed CPU fallback engine")
+                return engine
+
         config = ParakeetConfig(model_id=model_id, device=self._current_device)
         return ParakeetEngine(config)
 
+    def _take_prewarmed_cpu_engine(self) -> STTEngine | None:
+        if self._prewarm_thread is None:
+            return None
+        self._cpu_warm.wait()
+        with self._lock:
+            engine = self._prewarmed_cpu_engine
+            self._prewarmed_cpu_engine = None
+        return engine
+
+    def prewarm_fallback(self) -> None:
+        if self._prewarm_thread is not None or self._original_device == "cpu":
+            return
+
+        def _prewarm() -> None:
+            try:
+                from sidecar.stt.engines import ParakeetConfig, ParakeetEngine
+
+                logger.info("Prewarming CPU fallback engine in background")
+                engine = ParakeetEngine(
+                    ParakeetConfig(model_id=self.config.model_id, device="cpu")
+                )
+                engine.load()
+                with self._lock:
+                    self._prewarmed_cpu_engine = engine
+                logger.info("CPU fallback engine prewarmed")
+            except Exception as e:
+                logger.warning(f"CPU fallback prewarm failed: {e}")
+            finally:
+                self._cpu_warm.set()
+
+        self._prewarm_thread = threading.Thread(
+            target=_prewarm, name="stt-cpu-prewarm", daemon=True
+        )
+        self._prewarm_thread.start()
+
     def get_engine(self, model_id: str | None = None) -> ManagedEngine[STTEngine]:
         model_id = model_id or self.config.model_id
         with self._lock:
@@ -145,11 +256,32 @@ class STTEngineManager:
 
     def preload(self, model_id: str | None = None) -> None:
         model_id = model_id or self.config.model_id
+        if self.config.preload_fallbacks:
+            fallbacks = [m for m in self.config.fallback_models if m != model_id]
+            if fallbacks:
+                # Warm fallbacks off the critical path so an OOM on the main
+                # model doesn't serialize a cold load under a failing request.
+                threading.Thread(
+                    target=self._warm_fallbacks,
+                    args=(fallbacks,),
+                    name="stt-fallback-preload",
+                    daemon=True,
+                ).start()
+        self._warm_one(model_id)
+
+    def _warm_one(self, model_id: str) -> None:
         wrapper = self.get_engine(model_id)
         wrapper._load()
         wrapper._increment_ref()
         wrapper._decrement_ref()
 
+    def _warm_fallbacks(self, model_ids: list[str]) -> None:
+        for model_id in model_ids:
+            try:
+                self._warm_one(model_id)
+            except Exception as e:
+                logger.warning(f"Fallback preload of {model_id} failed: {e}")
+
     def force_unload(self, model_id: str | None = None) -> None:
         model_id = model_id or self.config.model_id
         with self._lock:
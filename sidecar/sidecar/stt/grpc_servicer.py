@@ -4,7 +4,7 @@ import logging
 from collections.abc import AsyncIterator
 from concurrent.futures import ThreadPoolExecutor
 
-from sidecar.audio.codecs import pcm16_to_float32, resample_audio
+from sidecar.audio.codecs import StreamingResampler, pcm16_to_float32
 from sidecar.audio.opus import OPUS_SAMPLE_RATE, OpusStreamDecoder
 from sidecar.domain.constants import TARGET_SAMPLE_RATE, samples_to_ms
 from sidecar.domain.entities import SpeechSession
@@ -92,6 +92,7 @@ class TranscriptionServiceServicer(stt_pb2_grpc.TranscriptionServiceServicer):
         domain_config: SessionConfig | None = None
         session = SpeechSession()
         opus_decoder: OpusStreamDecoder | None = None
+        resampler: StreamingResampler | None = None
         partial_service: PartialTranscriptService | None = None
 
         async for client_msg in request_iterator:
@@ -122,7 +123,9 @@ class TranscriptionServiceServicer(stt_pb2_grpc.TranscriptionServiceServicer):
                 audio = pcm16_to_float32(client_msg.audio.pcm16)
                 src_rate = client_msg.audio.sample_rate or pb_config.sample_rate or TARGET_SAMPLE_RATE
                 if src_rate != TARGET_SAMPLE_RATE:
-                    audio = resample_audio(audio, src_rate, TARGET_SAMPLE_RATE)
+                    if resampler is None or resampler.source_rate != src_rate:
+                        resampler = StreamingResampler(src_rate, TARGET_SAMPLE_RATE)
+                    audio = resampler.process(audio)
 
                 for msg in self._process_pipeline_events(pipeline, audio, session):
                     yield msg
@@ -151,7 +154,9 @@ class TranscriptionServiceServicer(stt_pb2_grpc.TranscriptionServiceServicer):
 
                 try:
                     audio = opus_decoder.decode_frame(opus_frame.data)
-                    audio = resample_audio(audio, OPUS_SAMPLE_RATE, TARGET_SAMPLE_RATE)
+                    if resampler is None or resampler.source_rate != OPUS_SAMPLE_RATE:
+                        resampler = StreamingResampler(OPUS_SAMPLE_RATE, TARGET_SAMPLE_RATE)
+                    audio = resampler.process(audio)
 
                     for msg in self._process_pipeline_events(pipeline, audio, session):
                         yield msg
@@ -13,7 +13,45 @@ logger = logging.getLogger(__name__)
 
 SAMPLE_RATE = 16000
 MS_SAMPLE_RATE = SAMPLE_RATE // 1000
-VAD_WINDOW_SIZE_SAMPLES = 1000 * MS_SAMPLE_RATE
+
+# At 16 kHz one millisecond is exactly 16 samples, so the ms/sample
+# conversions on the per-tick path reduce to bit shifts.
+assert SAMPLE_RATE == 16000, "sample/ms shift math assumes 16 kHz"
+_SR_SHIFT = 4
+
+
+def _samples_to_ms(n: int) -> int:
+    return n >> _SR_SHIFT
+
+
+def _ms_to_samples(n: int) -> int:
+    return n << _SR_SHIFT
+
+
+def _load_silero():
+    """Load the Silero VAD model, preferring the ONNX variant.
+
+    At batch 1 on CPU the ONNX graph runs through ORT's MLAS kernels with
+    far fewer Python dispatch hops than eager PyTorch, which matters when
+    the model is invoked on every audio tick. The PyTorch variant stays as
+    the fallback for hub releases where the ONNX export is unavailable.
+    """
+    logger.info("Loading Silero VAD model from torch.hub")
+    try:
+        return torch.hub.load(
+            repo_or_dir="snakers4/silero-vad:master",
+            model="silero_vad",
+            force_reload=False,
+            onnx=True,
+        )
+    except Exception as e:
+        logger.warning(f"ONNX Silero VAD unavailable, falling back to PyTorch: {e}")
+        return torch.hub.load(
+            repo_or_dir="snakers4/silero-vad:master",
+            model="silero_vad",
+            force_reload=False,
+            onnx=False,
+        )
 
 
 @dataclass
@@ -24,6 +62,7 @@ class VADConfig:
     min_speech_duration_ms: int = 250
     min_audio_duration_ms: int = 300
     max_utterance_ms: int = 15000
+    energy_floor: float = 0.01
 
 
 @dataclass
@@ -40,6 +79,13 @@ class SpeechSegment:
 
 
 class SileroVAD:
+    """Preload singleton that primes the torch.hub cache and warms the model.
+
+    Per-stream scoring happens in _StreamingScorer; this class only exists so
+    startup (_preload_models) can pay the hub download and first-inference
+    cost before traffic arrives.
+    """
+
     _instance: SileroVAD | None = None
     _model = None
     _get_speech_timestamps = None
@@ -56,13 +102,7 @@ class SileroVAD:
             return
         with SileroVAD._lock:
             if SileroVAD._model is None:
-                logger.info("Loading Silero VAD model from torch.hub")
-                model, utils = torch.hub.load(
-                    repo_or_dir="snakers4/silero-vad:master",
-                    model="silero_vad",
-                    force_reload=False,
-                    onnx=False,
-                )
+                model, utils = _load_silero()
                 SileroVAD._model = model
                 SileroVAD._get_speech_timestamps = utils[0]
                 warmup_audio = torch.zeros(SAMPLE_RATE)
@@ -71,61 +111,107 @@ class SileroVAD:
                 )
                 logger.info("Silero VAD model loaded")
 
-    def get_speech_timestamps(
-        self,
-        audio: NDArray[np.float32],
-        threshold: float = 0.5,
-        min_silence_duration_ms: int = 500,
-        speech_pad_ms: int = 100,
-        min_speech_duration_ms: int = 250,
-    ) -> list[dict[str, int]]:
-        self._ensure_model()
-
-        audio_tensor = torch.from_numpy(audio)
-        timestamps = SileroVAD._get_speech_timestamps(
-            audio_tensor,
-            SileroVAD._model,
-            threshold=threshold,
-            min_silence_duration_ms=min_silence_duration_ms,
-            speech_pad_ms=speech_pad_ms,
-            min_speech_duration_ms=min_speech_duration_ms,
-            sampling_rate=SAMPLE_RATE,
-        )
-        return timestamps
-
 
 MAX_BUFFER_SAMPLES = (15000 + 3000 + 1000) * MS_SAMPLE_RATE
 
+# Silero scores fixed 512-sample frames at 16 kHz (32 ms each).
+_VAD_FRAME_SAMPLES = 512
+_VAD_FRAME_MS = _samples_to_ms(_VAD_FRAME_SAMPLES)
+
+
+class _StreamingScorer:
+    """Per-stream Silero scorer with persistent recurrent state.
+
+    Rescoring the whole 1 s window on every tick runs the model over ~30
+    frames when only 1-3 new ones arrived — O(window) work per tick for an
+    O(new audio) signal. Keeping the model's LSTM state between appends
+    scores each frame exactly once. The state lives inside the model, so
+    every stream gets its own instance; the ONNX session behind it is ~2 MB
+    and torch.hub serves repeat loads from the on-disk cache.
+    """
+
+    __slots__ = ("_model", "_frame", "_pending", "_pending_n")
+
+    def __init__(self) -> None:
+        self._model = _load_silero()[0]
+        self._frame = torch.empty(_VAD_FRAME_SAMPLES, dtype=torch.float32)
+        self._pending = np.empty(_VAD_FRAME_SAMPLES, dtype=np.float32)
+        self._pending_n = 0
+
+    def _score_frame(self, frame: NDArray[np.float32]) -> float:
+        self._frame.numpy()[:] = frame
+        return float(self._model(self._frame, SAMPLE_RATE))
+
+    def score(self, audio: NDArray[np.float32], silent: bool = False) -> list[float]:
+        """Return one speech probability per completed 512-sample frame.
+
+        Partial frames are held back until the next call. With silent=True
+        the frames are consumed as probability 0.0 without touching the
+        model, mirroring the energy-floor gate that used to skip the whole
+        window scoring before speech started.
+        """
+        probs: list[float] = []
+        n = audio.shape[0]
+        i = 0
+
+        if self._pending_n:
+            take = min(_VAD_FRAME_SAMPLES - self._pending_n, n)
+            self._pending[self._pending_n:self._pending_n + take] = audio[:take]
+            self._pending_n += take
+            i = take
+            if self._pending_n < _VAD_FRAME_SAMPLES:
+                return probs
+            probs.append(0.0 if silent else self._score_frame(self._pending))
+            self._pending_n = 0
+
+        while i + _VAD_FRAME_SAMPLES <= n:
+            probs.append(0.0 if silent else self._score_frame(audio[i:i + _VAD_FRAME_SAMPLES]))
+            i += _VAD_FRAME_SAMPLES
+
+        rest = n - i
+        if rest:
+            self._pending[:rest] = audio[i:n]
+            self._pending_n = rest
+        return probs
+
+    def reset(self) -> None:
+        self._pending_n = 0
+        self._model.reset_states()
+
 
 class AudioRingBuffer:
-    __slots__ = ("_buffer", "_write_pos", "_length")
+    __slots__ = ("_buffer", "_write_pos", "_length", "_cap")
 
     def __init__(self, max_samples: int = MAX_BUFFER_SAMPLES) -> None:
         self._buffer = np.zeros(max_samples, dtype=np.float32)
         self._write_pos = 0
         self._length = 0
+        self._cap = max_samples
 
     def append(self, audio: NDArray[np.float32]) -> None:
-        n = len(audio)
+        n = audio.shape[0]
         if n == 0:
             return
 
-        if n >= len(self._buffer):
-            self._buffer[:] = audio[-len(self._buffer):]
+        cap = self._cap
+        if n >= cap:
+            np.copyto(self._buffer, audio[-cap:])
             self._write_pos = 0
-            self._length = len(self._buffer)
+            self._length = cap
             return
 
         end_pos = self._write_pos + n
-        if end_pos <= len(self._buffer):
-            self._buffer[self._write_pos:end_pos] = audio
+        if end_pos <= cap:
+            np.copyto(self._buffer[self._write_pos:end_pos], audio)
         else:
-            first_part = len(self._buffer) - self._write_pos
-            self._buffer[self._write_pos:] = audio[:first_part]
-            self._buffer[:n - first_part] = audio[first_part:]
+            first_part = cap - self._write_pos
+            np.copyto(self._buffer[self._write_pos:], audio[:first_part])
+            np.copyto(self._buffer[:n - first_part], audio[first_part:])
 
-        self._write_pos = end_pos % len(self._buffer)
-        self._length = min(self._length + n, len(self._buffer))
+        # end_pos < 2 * cap here, so the modulo reduces to compare-subtract.
+        self._write_pos = end_pos - cap if end_pos >= cap else end_pos
+        length = self._length + n
+        self._length = cap if length > cap else length
 
     def get_last_n(self, n: int) -> NDArray[np.float32]:
         n = min(n, self._length)
@@ -133,7 +219,7 @@ class AudioRingBuffer:
             return np.array([], dtype=np.float32)
 
         end_pos = self._write_pos
-        start_pos = (end_pos - n) % len(self._buffer)
+        start_pos = (end_pos - n) % self._cap
 
         if start_pos < end_pos:
             return self._buffer[start_pos:end_pos].copy()
@@ -149,9 +235,9 @@ class AudioRingBuffer:
         if start_sample >= end_sample:
             return np.array([], dtype=np.float32)
 
-        oldest_pos = (self._write_pos - self._length) % len(self._buffer)
-        actual_start = (oldest_pos + start_sample) % len(self._buffer)
-        actual_end = (oldest_pos + end_sample) % len(self._buffer)
+        oldest_pos = (self._write_pos - self._length) % self._cap
+        actual_start = (oldest_pos + start_sample) % self._cap
+        actual_end = (oldest_pos + end_sample) % self._cap
 
         if actual_start < actual_end:
             return self._buffer[actual_start:actual_end].copy()
@@ -171,62 +257,95 @@ class VADProcessor:
     config: VADConfig = field(default_factory=VADConfig)
     state: VADState = field(default_factory=VADState)
     buffer: AudioRingBuffer = field(default_factory=AudioRingBuffer)
-    _vad_model: SileroVAD = field(default_factory=SileroVAD)
-
-    def _duration_ms(self) -> int:
-        return len(self.buffer) // MS_SAMPLE_RATE
+    _scorer: _StreamingScorer | None = field(default=None, repr=False)
+    # Hysteresis state for the incremental start/end detection; all in ms on
+    # the stream timeline (audio appended since the last clear). The ring
+    # buffer only retains the newest MAX_BUFFER_SAMPLES of that stream, so
+    # _extract_segment rebases these offsets by the evicted prefix before
+    # slicing.
+    _scored_ms: int = 0
+    _candidate_start_ms: int | None = None
+    _last_speech_ms: int = 0
+    _silence_ms: int = 0
+    _appended_samples: int = 0
+
+    def _stream_ms(self) -> int:
+        return _samples_to_ms(self._appended_samples)
 
     def append(self, audio: NDArray[np.float32]) -> tuple[SpeechStarted | SpeechStopped | None, SpeechSegment | None]:
         self.buffer.append(audio)
-
-        audio_window = self.buffer.get_last_n(VAD_WINDOW_SIZE_SAMPLES)
-        window_duration_ms = len(audio_window) // MS_SAMPLE_RATE
-
-        raw_timestamps = self._vad_model.get_speech_timestamps(
-            audio_window,
-            threshold=self.config.threshold,
-            min_silence_duration_ms=self.config.min_silence_duration_ms,
-            speech_pad_ms=self.config.speech_pad_ms,
-            min_speech_duration_ms=self.config.min_speech_duration_ms,
-        )
-
-        speech_ts = None
-        if raw_timestamps:
-            merged = {
-                "start": min(ts["start"] for ts in raw_timestamps),
-                "end": max(ts["end"] for ts in raw_timestamps),
-            }
-            speech_ts = merged
-
-        if self.state.audio_start_ms is None:
-            if speech_ts is None:
-                return None, None
-
-            self.state.audio_start_ms = (
-                self._duration_ms() - window_duration_ms + (speech_ts["start"] // MS_SAMPLE_RATE)
-            )
-            return SpeechStarted(timestamp_ms=self.state.audio_start_ms), None
-
-        else:
-            if speech_ts is None:
-                self.state.audio_end_ms = self._duration_ms() - self.config.speech_pad_ms
-                segment = self._extract_segment()
-                self._clear_buffer()
-                if segment.end_ms - segment.start_ms < self.config.min_audio_duration_ms:
-                    logger.debug(f"Segment too short ({segment.end_ms - segment.start_ms}ms), skipping STT")
-                    return SpeechStopped(timestamp_ms=self.state.audio_end_ms), None
-                return SpeechStopped(timestamp_ms=self.state.audio_end_ms), segment
-
-            if self._duration_ms() >= self.config.max_utterance_ms:
-                self.state.audio_end_ms = self._duration_ms() - self.config.speech_pad_ms
-                segment = self._extract_segment()
-                self._clear_buffer()
-                if segment.end_ms - segment.start_ms < self.config.min_audio_duration_ms:
-                    logger.debug(
-                        f"Segment too short after max_utterance cap ({segment.end_ms - segment.start_ms}ms), skipping STT"
-                    )
-                    return SpeechStopped(timestamp_ms=self.state.audio_end_ms), None
-                return SpeechStopped(timestamp_ms=self.state.audio_end_ms), segment
+        self._appended_samples += audio.shape[0]
+
+        if self._scorer is None:
+            self._scorer = _StreamingScorer()
+
+        # Before speech has started, skip the Silero forward pass entirely
+        # when the new audio is effectively silent. Once a candidate start
+        # exists the model always runs so transitions are not missed.
+        silent = False
+        if self.state.audio_start_ms is None and self._candidate_start_ms is None:
+            peak = float(np.max(np.abs(audio))) if len(audio) else 0.0
+            silent = peak < self.config.energy_floor
+
+        threshold = self.config.threshold
+        # Same hysteresis the torch.hub helper applies: once speech has
+        # triggered, only clearly-non-speech frames count as silence.
+        neg_threshold = max(threshold - 0.15, 0.01)
+
+        for prob in self._scorer.score(audio, silent=silent):
+            frame_start_ms = self._scored_ms
+            self._scored_ms += _VAD_FRAME_MS
+            pos_ms = self._scored_ms
+
+            if self.state.audio_start_ms is None:
+                if prob >= threshold:
+                    if self._candidate_start_ms is None:
+                        self._candidate_start_ms = frame_start_ms
+                    self._last_speech_ms = pos_ms
+                    # Fire the start only once speech has spanned the
+                    # minimum duration, like the helper's min_speech filter;
+                    # short gaps inside the span do not reset the candidate.
+                    if pos_ms - self._candidate_start_ms >= self.config.min_speech_duration_ms:
+                        self.state.audio_start_ms = max(
+                            0, self._candidate_start_ms - self.config.speech_pad_ms
+                        )
+                        return SpeechStarted(timestamp_ms=self.state.audio_start_ms), None
+                elif (
+                    self._candidate_start_ms is not None
+                    and prob < neg_threshold
+                    and pos_ms - self._last_speech_ms >= self.config.min_silence_duration_ms
+                ):
+                    # The blip never reached min_speech and has gone quiet.
+                    self._candidate_start_ms = None
+
+            else:
+                if prob < neg_threshold:
+                    self._silence_ms += _VAD_FRAME_MS
+                else:
+                    self._silence_ms = 0
+
+                if self._silence_ms >= self.config.min_silence_duration_ms:
+                    self.state.audio_end_ms = self._stream_ms() - self.config.speech_pad_ms
+                    segment = self._extract_segment()
+                    self._clear_buffer()
+                    if segment.end_ms - segment.start_ms < self.config.min_audio_duration_ms:
+                        logger.debug(f"Segment too short ({segment.end_ms - segment.start_ms}ms), skipping STT")
+                        return SpeechStopped(timestamp_ms=self.state.audio_end_ms), None
+                    return SpeechStopped(timestamp_ms=self.state.audio_end_ms), segment
+
+        if (
+            self.state.audio_start_ms is not None
+            and self._stream_ms() - self.state.audio_start_ms >= self.config.max_utterance_ms
+        ):
+            self.state.audio_end_ms = self._stream_ms() - self.config.speech_pad_ms
+            segment = self._extract_segment()
+            self._clear_buffer()
+            if segment.end_ms - segment.start_ms < self.config.min_audio_duration_ms:
+                logger.debug(
+                    f"Segment too short after max_utterance cap ({segment.end_ms - segment.start_ms}ms), skipping STT"
+                )
+                return SpeechStopped(timestamp_ms=self.state.audio_end_ms), None
+            return SpeechStopped(timestamp_ms=self.state.audio_end_ms), segment
 
         return None, None
 
@@ -234,8 +353,13 @@ class VADProcessor:
         if self.state.audio_start_ms is None or self.state.audio_end_ms is None:
             return SpeechSegment(audio=np.array([], dtype=np.float32), start_ms=0, end_ms=0)
 
-        start_sample = self.state.audio_start_ms * MS_SAMPLE_RATE
-        end_sample = self.state.audio_end_ms * MS_SAMPLE_RATE
+        # Start/end live on the stream timeline while get_slice indexes from
+        # the oldest sample the ring still holds. Rebase by the evicted
+        # prefix so a long pre-speech stretch (beyond the ring's capacity)
+        # cannot push the slice out of range and silently drop the segment.
+        evicted = self._appended_samples - len(self.buffer)
+        start_sample = max(0, _ms_to_samples(self.state.audio_start_ms) - evicted)
+        end_sample = _ms_to_samples(self.state.audio_end_ms) - evicted
 
         return SpeechSegment(
             audio=self.buffer.get_slice(start_sample, end_sample),
@@ -246,6 +370,13 @@ class VADProcessor:
     def _clear_buffer(self) -> None:
         self.buffer.clear()
         self.state = VADState()
+        self._scored_ms = 0
+        self._candidate_start_ms = None
+        self._last_speech_ms = 0
+        self._silence_ms = 0
+        self._appended_samples = 0
+        if self._scorer is not None:
+            self._scorer.reset()
 
     def reset(self) -> None:
         self._clear_buffer()
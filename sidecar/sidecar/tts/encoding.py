@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import io
 import logging
+import threading
+from concurrent.futures import Executor
 
 import numpy as np
 import soundfile as sf
@@ -21,8 +24,21 @@ except ImportError:
 
 OPUS_FRAME_MS = 20
 
+_tls = threading.local()
 
-def _encode_opus_native(pcm16: bytes, sample_rate: int) -> bytes:
+
+def _scratch_buffer() -> io.BytesIO:
+    # Reuse one BytesIO per worker thread; repeated encodes then write into
+    # already-grown storage instead of reallocating from scratch each call.
+    buf = getattr(_tls, "buf", None)
+    if buf is None:
+        buf = _tls.buf = io.BytesIO()
+    buf.seek(0)
+    buf.truncate()
+    return buf
+
+
+def _encode_opus_native(pcm16: bytes | bytearray | memoryview, sample_rate: int) -> bytes:
     if not _HAS_OPUSLIB:
         raise SynthesisError("opuslib not available for Opus encoding", code=5)
 
@@ -42,20 +58,57 @@ def _encode_opus_native(pcm16: bytes, sample_rate: int) -> bytes:
     return b"".join(frames)
 
 
-def encode_audio(pcm16: bytes, sample_rate: int, fmt: str) -> tuple[bytes, str]:
+class StreamingFileEncoder:
+    """Incremental WAV/FLAC encoder writing into an in-memory file.
+
+    libsndfile encodes samples as they arrive and fixes up the container
+    header when the file is closed, so the servicers can feed PCM chunk by
+    chunk instead of accumulating a whole utterance and encoding it in one
+    shot at the end. flush() finalizes the stream and returns the complete
+    file bytes.
+    """
+
+    def __init__(self, sample_rate: int, fmt: str) -> None:
+        self._buf = io.BytesIO()
+        self._file = sf.SoundFile(
+            self._buf,
+            mode="w",
+            samplerate=sample_rate,
+            channels=1,
+            format=fmt.upper(),
+            subtype="PCM_16",
+        )
+
+    def write(self, pcm16: bytes | bytearray | memoryview | np.ndarray) -> None:
+        if not isinstance(pcm16, np.ndarray):
+            pcm16 = np.frombuffer(pcm16, dtype=np.int16)
+        self._file.write(pcm16)
+
+    def flush(self) -> bytes:
+        self._file.close()
+        return self._buf.getvalue()
+
+    def close(self) -> None:
+        with contextlib.suppress(Exception):
+            self._file.close()
+
+
+def encode_audio(pcm16: bytes | bytearray | memoryview, sample_rate: int, fmt: str) -> tuple[bytes, str]:
     fmt = (fmt or "pcm").lower()
 
     if fmt in ("pcm", "s16le"):
-        return pcm16, "pcm"
+        # np.frombuffer reads any buffer without copying; only the pcm
+        # passthrough needs to materialize real bytes for the caller.
+        return pcm16 if isinstance(pcm16, bytes) else bytes(pcm16), "pcm"
 
     if fmt == "wav":
-        buf = io.BytesIO()
+        buf = _scratch_buffer()
         data = np.frombuffer(pcm16, dtype=np.int16)
         sf.write(buf, data, samplerate=sample_rate, format="WAV", subtype="PCM_16")
         return buf.getvalue(), "wav"
 
     if fmt == "flac":
-        buf = io.BytesIO()
+        buf = _scratch_buffer()
         data = np.frombuffer(pcm16, dtype=np.int16)
         sf.write(buf, data, samplerate=sample_rate, format="FLAC", subtype="PCM_16")
         return buf.getvalue(), "flac"
@@ -66,27 +119,32 @@ def encode_audio(pcm16: bytes, sample_rate: int, fmt: str) -> tuple[bytes, str]:
     raise SynthesisError(f"unsupported response_format: {fmt}", code=5)
 
 
-async def encode_audio_async(pcm16: bytes, sample_rate: int, fmt: str) -> tuple[bytes, str]:
+async def encode_audio_async(
+    pcm16: bytes | bytearray | memoryview,
+    sample_rate: int,
+    fmt: str,
+    executor: Executor | None = None,
+) -> tuple[bytes, str]:
     fmt = (fmt or "pcm").lower()
 
     if fmt in ("pcm", "s16le"):
-        return pcm16, "pcm"
+        return pcm16 if isinstance(pcm16, bytes) else bytes(pcm16), "pcm"
 
     if fmt == "wav":
-        buf = io.BytesIO()
+        buf = _scratch_buffer()
         data = np.frombuffer(pcm16, dtype=np.int16)
         sf.write(buf, data, samplerate=sample_rate, format="WAV", subtype="PCM_16")
         return buf.getvalue(), "wav"
 
     if fmt == "flac":
-        buf = io.BytesIO()
+        buf = _scratch_buffer()
         data = np.frombuffer(pcm16, dtype=np.int16)
         sf.write(buf, data, samplerate=sample_rate, format="FLAC", subtype="PCM_16")
         return buf.getvalue(), "flac"
 
     if fmt == "opus":
         loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(None, _encode_opus_native, pcm16, sample_rate)
+        result = await loop.run_in_executor(executor, _encode_opus_native, pcm16, sample_rate)
         return result, "opus"
 
     raise SynthesisError(f"unsupported response_format: {fmt}", code=5)
@@ -8,14 +8,66 @@ from concurrent.futures import ThreadPoolExecutor
 
 from sidecar.tts import pb2 as tts_pb2
 from sidecar.tts import pb2_grpc as tts_pb2_grpc
-from sidecar.tts.encoding import encode_audio_async
+from sidecar.tts.encoding import StreamingFileEncoder
 from sidecar.tts.model_manager import KOKORO_VOICES, KokoroModelManager, SAMPLE_RATE, SynthesisConfig
 from sidecar.tts.mp3_encoder import StreamingMP3Encoder, has_native_mp3
 from sidecar.tts.opus_encoder import StreamingOpusEncoder, has_native_opus
-from sidecar.tts.synthesis import SynthesisError, Synthesizer, float32_to_pcm16
+from sidecar.tts.synthesis import SynthesisError, Synthesizer, float32_to_pcm16, float32_to_pcm16_scratch
 
 logger = logging.getLogger(__name__)
 
+# Target ~30 ms of PCM per streamed message; smaller chunks are coalesced to
+# amortize protobuf construction and gRPC framing.
+COALESCE_MIN_BYTES = int(SAMPLE_RATE * 2 * 0.03)
+
+VALID_FORMATS = frozenset({"pcm", "opus", "mp3", "wav", "flac"})
+_VALID_FORMATS_STR = ", ".join(sorted(VALID_FORMATS))
+
+OPUS_SAMPLE_RATE = 48000
+
+
+class _ChunkCoalescer:
+    """Accumulates byte-stream payloads (PCM/MP3) into larger messages.
+
+    The first payload passes through untouched so time-to-first-byte is not
+    regressed; afterwards data is held back until min_bytes accumulate.
+    Opus is not coalesced because its packets must stay individually framed.
+    """
+
+    __slots__ = ("_min_bytes", "_parts", "_size", "_first")
+
+    def __init__(self, min_bytes: int = COALESCE_MIN_BYTES) -> None:
+        self._min_bytes = min_bytes
+        self._parts: list[bytes] = []
+        self._size = 0
+        self._first = True
+
+    def add(self, data: bytes) -> bytes | None:
+        if self._first:
+            self._first = False
+            return data
+        self._parts.append(data)
+        self._size += len(data)
+        if self._size >= self._min_bytes:
+            return self.flush()
+        return None
+
+    def flush(self) -> bytes | None:
+        if not self._parts:
+            return None
+        data = self._parts[0] if len(self._parts) == 1 else b"".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        return data
+
+
+def swallow_warmup_result(task: asyncio.Task) -> None:
+    # Warmup failures surface later on the synthesis path with proper error
+    # mapping; this just keeps the fire-and-forget task from logging
+    # "exception was never retrieved".
+    if not task.cancelled():
+        task.exception()
+
 
 class TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer):
     def __init__(
@@ -27,6 +79,37 @@ class TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer):
         self.model_manager = model_manager
         self.config = config
         self.executor = executor
+        self._synthesizers: dict[float, Synthesizer] = {}
+        # The voice and model catalogs are static for the process lifetime;
+        # build the responses once instead of per RPC.
+        self._voices_response = tts_pb2.ListVoicesResponse(voices=[
+            tts_pb2.Voice(
+                id=voice_id,
+                name=voice_id.split("_")[1].title(),
+                language=lang,
+                gender=gender,
+            )
+            for voice_id, lang, gender in KOKORO_VOICES
+        ])
+        self._models_response = tts_pb2.ListModelsResponse(models=[
+            tts_pb2.TTSModel(
+                id=self.model_manager.config.model_id,
+                name="Kokoro",
+                description="Kokoro TTS model",
+            ),
+        ])
+
+    def _get_synthesizer(self, speed: float) -> Synthesizer:
+        # Synthesizer holds only the manager and config, so instances are
+        # safely shared across concurrent requests; cache per speed instead
+        # of allocating a fresh config + synthesizer every session.
+        synthesizer = self._synthesizers.get(speed)
+        if synthesizer is None:
+            synth_config = self.config if speed == self.config.speed else SynthesisConfig(speed=speed)
+            synthesizer = Synthesizer(self.model_manager, synth_config)
+            if len(self._synthesizers) < 32:
+                self._synthesizers[speed] = synthesizer
+        return synthesizer
 
     async def _parse_tts_config(
         self, request_iterator
@@ -37,10 +120,24 @@ class TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer):
         response_format = "pcm"
         errors: list[tts_pb2.TtsServerMessage] = []
 
+        # HasField on a oneof member is a constant-time presence check,
+        # cheaper per message than WhichOneof's string return + comparisons.
+        # Text messages dominate, so they are tested first.
         async for client_msg in request_iterator:
-            msg_type = client_msg.WhichOneof("msg")
+            if client_msg.HasField("text"):
+                if session_config is None:
+                    errors.append(tts_pb2.TtsServerMessage(
+                        error=tts_pb2.TtsError(message="Session not configured", code=2)
+                    ))
+                    continue
+                # Strip per chunk so the joined text never needs a second
+                # whitespace pass and empty chunks cost nothing downstream.
+                text = client_msg.text.text.strip()
+                if text:
+                    text_chunks.append(text)
+                continue
 
-            if msg_type == "config":
+            if client_msg.HasField("config"):
                 if session_config is not None:
                     errors.append(tts_pb2.TtsServerMessage(
                         error=tts_pb2.TtsError(message="Session already configured", code=1)
@@ -52,33 +149,30 @@ class TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer):
                 if session_config.response_format:
                     response_format = session_config.response_format.lower()
 
-                logger.info(f"TTS session configured: voice={voice_id}")
-                continue
+                # Kick the model load off while the client is still sending
+                # text, so a cold start overlaps the network receive instead
+                # of delaying the first generate.
+                warm = asyncio.create_task(self.model_manager.get_kokoro())
+                warm.add_done_callback(swallow_warmup_result)
 
-            if msg_type == "text":
-                if session_config is None:
-                    errors.append(tts_pb2.TtsServerMessage(
-                        error=tts_pb2.TtsError(message="Session not configured", code=2)
-                    ))
-                    continue
-                text_chunks.append(client_msg.text.text)
+                logger.info("TTS session configured: voice=%s", voice_id)
                 continue
 
-            if msg_type == "end":
+            if client_msg.HasField("end"):
                 break
 
         return session_config, text_chunks, voice_id, response_format, errors
 
     def _create_audio_chunk(
-        self, data: bytes | bytearray, format: str, audio_samples: int, transcript: str | None = None
+        self, data: bytes, format: str, audio_samples: int, transcript: str | None = None
     ) -> tts_pb2.TtsServerMessage:
-        sample_rate = 48000 if format == "opus" else SAMPLE_RATE
+        sample_rate = OPUS_SAMPLE_RATE if format == "opus" else SAMPLE_RATE
         return tts_pb2.TtsServerMessage(
             audio=tts_pb2.AudioChunk(
-                data=bytes(data) if isinstance(data, bytearray) else data,
+                data=data,
                 format=format,
                 sample_rate=sample_rate,
-                timestamp_ms=int(audio_samples * 1000 / SAMPLE_RATE),
+                timestamp_ms=audio_samples * 1000 // SAMPLE_RATE,
                 transcript=transcript or "",
             )
         )
@@ -87,9 +181,9 @@ class TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer):
         self, audio_samples: int, start_time: float, full_text: str
     ) -> tts_pb2.TtsServerMessage:
         processing_ms = int((time.perf_counter() - start_time) * 1000)
-        audio_ms = int(audio_samples * 1000 / SAMPLE_RATE)
+        audio_ms = audio_samples * 1000 // SAMPLE_RATE
 
-        logger.info(f"TTS done: {audio_ms}ms audio, {processing_ms}ms processing")
+        logger.info("TTS done: %dms audio, %dms processing", audio_ms, processing_ms)
 
         return tts_pb2.TtsServerMessage(
             done=tts_pb2.TtsDone(
@@ -125,39 +219,51 @@ class TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer):
             )
             return
 
-        full_text = " ".join(text_chunks).strip()
-        if not full_text:
+        # Cheapest checks first: reject a bad format before joining the text
+        # chunks, and join the text before any synthesizer/encoder setup.
+        if response_format not in VALID_FORMATS:
             yield tts_pb2.TtsServerMessage(
-                error=tts_pb2.TtsError(message="No text provided", code=4)
+                error=tts_pb2.TtsError(
+                    message=f"Invalid format '{response_format}'. Supported: {_VALID_FORMATS_STR}",
+                    code=7,
+                )
             )
             return
 
-        valid_formats = {"pcm", "opus", "mp3", "wav", "flac"}
-        if response_format not in valid_formats:
+        if not text_chunks:
             yield tts_pb2.TtsServerMessage(
-                error=tts_pb2.TtsError(
-                    message=f"Invalid format '{response_format}'. Supported: {', '.join(sorted(valid_formats))}",
-                    code=7,
-                )
+                error=tts_pb2.TtsError(message="No text provided", code=4)
             )
             return
 
-        speed = session_config.speed if session_config.speed > 0 else self.config.speed
-        synth_config = SynthesisConfig(speed=speed)
+        full_text = " ".join(text_chunks)
 
-        synthesizer = Synthesizer(self.model_manager, synth_config)
+        speed = session_config.speed if session_config.speed > 0 else self.config.speed
+        synthesizer = self._get_synthesizer(speed)
         stop_event = asyncio.Event()
+        # Bubble client disconnect/cancellation into the synthesizer so
+        # inference stops mid-generation instead of running to completion
+        # for a stream nobody is reading.
+        context.add_done_callback(lambda _ctx: stop_event.set())
 
+        loop = asyncio.get_running_loop()
         start_time = time.perf_counter()
         audio_samples = 0
         chunk_count = 0
-        buffer = bytearray()
         stream_pcm = response_format == "pcm"
         stream_opus = response_format == "opus"
         stream_mp3 = response_format == "mp3"
+        coalescer = _ChunkCoalescer()
 
         opus_encoder: StreamingOpusEncoder | None = None
         mp3_encoder: StreamingMP3Encoder | None = None
+        file_encoder: StreamingFileEncoder | None = None
+
+        if not (stream_pcm or stream_opus or stream_mp3):
+            # WAV/FLAC are encoded incrementally as chunks arrive instead of
+            # accumulating the whole utterance's PCM and encoding at the end;
+            # libsndfile fixes up the container header on flush.
+            file_encoder = StreamingFileEncoder(SAMPLE_RATE, response_format)
 
         if stream_opus:
             if not has_native_opus():
@@ -175,35 +281,113 @@ class TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer):
                 return
             mp3_encoder = StreamingMP3Encoder(sample_rate=SAMPLE_RATE, channels=1, bitrate=128)
 
+        # Pipeline synthesis against encoding/framing: a producer task feeds
+        # raw chunks through a small bounded queue so inference for chunk N+1
+        # overlaps with encoding and gRPC framing of chunk N.
+        synth_queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+        async def _produce() -> None:
+            try:
+                async for chunk in synthesizer.synthesize(
+                    text=full_text,
+                    voice_id=voice_id,
+                    stop_event=stop_event,
+                ):
+                    await synth_queue.put(chunk)
+            except Exception as e:
+                await synth_queue.put(e)
+            else:
+                await synth_queue.put(None)
+
+        producer = asyncio.create_task(_produce())
+
+        # The Opus/MP3/file encoders consume the PCM before the next chunk is
+        # converted, so they can read the per-thread int16 scratch directly
+        # and skip the bytes copy. Only the pcm path holds PCM across
+        # iterations (in the coalescer) and needs real bytes.
+        to_pcm16 = float32_to_pcm16 if stream_pcm else float32_to_pcm16_scratch
+
+        # Hot-loop aliases: the output sample rate is fixed per session and
+        # the message classes are resolved once instead of per chunk.
+        out_sr = OPUS_SAMPLE_RATE if stream_opus else SAMPLE_RATE
+        _ServerMessage = tts_pb2.TtsServerMessage
+        _AudioChunk = tts_pb2.AudioChunk
+        _EMPTY: tuple[tts_pb2.TtsServerMessage, ...] = ()
+
+        # The format branch is session-invariant, so resolve it to one
+        # specialized handler here instead of re-testing three flags per
+        # chunk. Each handler returns the messages to stream for one chunk.
+        if stream_pcm:
+            async def handle_chunk(pcm16, samples: int):
+                batched = coalescer.add(pcm16)
+                if batched is None:
+                    return _EMPTY
+                return (_ServerMessage(audio=_AudioChunk(
+                    data=batched,
+                    format="pcm",
+                    sample_rate=out_sr,
+                    timestamp_ms=samples * 1000 // SAMPLE_RATE,
+                )),)
+        elif stream_opus:
+            async def handle_chunk(pcm16, samples: int):
+                # Native encodes are CPU-bound; run them on the TTS executor
+                # so other streams keep making progress. Each encoder lives
+                # in one Synthesize coroutine, so calls stay serialized.
+                frames = await loop.run_in_executor(
+                    self.executor, opus_encoder.encode, pcm16
+                )
+                ts = samples * 1000 // SAMPLE_RATE
+                return tuple(
+                    _ServerMessage(audio=_AudioChunk(
+                        data=frame, format="opus", sample_rate=out_sr, timestamp_ms=ts
+                    ))
+                    for frame in frames
+                )
+        elif stream_mp3:
+            async def handle_chunk(pcm16, samples: int):
+                mp3_data = await loop.run_in_executor(
+                    self.executor, mp3_encoder.encode, pcm16
+                )
+                batched = coalescer.add(mp3_data) if mp3_data else None
+                if batched is None:
+                    return _EMPTY
+                return (_ServerMessage(audio=_AudioChunk(
+                    data=batched,
+                    format="mp3",
+                    sample_rate=out_sr,
+                    timestamp_ms=samples * 1000 // SAMPLE_RATE,
+                )),)
+        else:
+            async def handle_chunk(pcm16, samples: int):
+                # FLAC compression in particular is CPU-bound; keep the
+                # libsndfile write off the event loop like the other
+                # native encoders.
+                await loop.run_in_executor(self.executor, file_encoder.write, pcm16)
+                return _EMPTY
+
         try:
-            async for audio_chunk in synthesizer.synthesize(
-                text=full_text,
-                voice_id=voice_id,
-                stop_event=stop_event,
-            ):
-                pcm16 = float32_to_pcm16(audio_chunk)
+            while True:
+                audio_chunk = await synth_queue.get()
+                if audio_chunk is None:
+                    break
+                if isinstance(audio_chunk, Exception):
+                    raise audio_chunk
+
+                pcm16 = to_pcm16(audio_chunk)
                 audio_samples += len(audio_chunk)
                 chunk_count += 1
 
-                if stream_pcm:
-                    yield self._create_audio_chunk(pcm16, "pcm", audio_samples, full_text)
-                elif stream_opus and opus_encoder is not None:
-                    encoded_frames = opus_encoder.encode(pcm16)
-                    for frame in encoded_frames:
-                        yield self._create_audio_chunk(frame, "opus", audio_samples)
-                elif stream_mp3 and mp3_encoder is not None:
-                    mp3_data = mp3_encoder.encode(pcm16)
-                    if mp3_data:
-                        yield self._create_audio_chunk(mp3_data, "mp3", audio_samples)
-                else:
-                    buffer.extend(pcm16)
+                for msg in await handle_chunk(pcm16, audio_samples):
+                    yield msg
 
         except SynthesisError as e:
-            logger.error(f"Synthesis error: {e}")
+            logger.error("Synthesis error: %s", e)
             if opus_encoder is not None:
                 opus_encoder.close()
             if mp3_encoder is not None:
                 mp3_encoder.close()
+            if file_encoder is not None:
+                file_encoder.close()
             yield tts_pb2.TtsServerMessage(
                 error=tts_pb2.TtsError(message=str(e), code=e.code)
             )
@@ -215,49 +399,48 @@ class TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer):
                 opus_encoder.close()
             if mp3_encoder is not None:
                 mp3_encoder.close()
+            if file_encoder is not None:
+                file_encoder.close()
             yield tts_pb2.TtsServerMessage(
                 error=tts_pb2.TtsError(message=f"Unexpected error: {e}", code=99)
             )
             return
 
+        finally:
+            if not producer.done():
+                stop_event.set()
+                producer.cancel()
+
+        if stream_pcm or stream_mp3:
+            tail = coalescer.flush()
+            if tail:
+                yield self._create_audio_chunk(
+                    tail, "pcm" if stream_pcm else "mp3", audio_samples
+                )
+
         if stream_opus and opus_encoder is not None:
-            flush_frames = opus_encoder.flush()
+            flush_frames = await loop.run_in_executor(self.executor, opus_encoder.flush)
             for frame in flush_frames:
-                yield self._create_audio_chunk(frame, "opus", audio_samples, full_text)
+                yield self._create_audio_chunk(frame, "opus", audio_samples)
         elif stream_mp3 and mp3_encoder is not None:
-            flush_data = mp3_encoder.flush()
+            flush_data = await loop.run_in_executor(self.executor, mp3_encoder.flush)
             if flush_data:
-                yield self._create_audio_chunk(flush_data, "mp3", audio_samples, full_text)
-        elif not stream_pcm:
+                yield self._create_audio_chunk(flush_data, "mp3", audio_samples)
+        elif file_encoder is not None:
             try:
-                encoded, enc_format = await encode_audio_async(bytes(buffer), SAMPLE_RATE, response_format)
-                yield self._create_audio_chunk(encoded, enc_format, audio_samples, full_text)
-            except SynthesisError as e:
-                logger.error(f"Encoding error: {e}")
+                encoded = await loop.run_in_executor(self.executor, file_encoder.flush)
+                yield self._create_audio_chunk(encoded, response_format, audio_samples)
+            except Exception as e:
+                logger.error("Encoding error: %s", e)
                 yield tts_pb2.TtsServerMessage(
-                    error=tts_pb2.TtsError(message=str(e), code=e.code)
+                    error=tts_pb2.TtsError(message=f"Encoding failed: {e}", code=5)
                 )
                 return
 
         yield self._create_done_message(audio_samples, start_time, full_text)
 
     def ListVoices(self, request, context):
-        voices = []
-        for voice_id, lang, gender in KOKORO_VOICES:
-            voices.append(tts_pb2.Voice(
-                id=voice_id,
-                name=voice_id.split("_")[1].title(),
-                language=lang,
-                gender=gender,
-            ))
-        return tts_pb2.ListVoicesResponse(voices=voices)
+        return self._voices_response
 
     def ListModels(self, request, context):
-        models = [
-            tts_pb2.TTSModel(
-                id=self.model_manager.config.model_id,
-                name="Kokoro",
-                description="Kokoro TTS model",
-            ),
-        ]
-        return tts_pb2.ListModelsResponse(models=models)
+        return self._models_response
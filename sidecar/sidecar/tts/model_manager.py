@@ -1,23 +1,68 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import os
 import platform
+import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+import numpy as np
 from huggingface_hub import hf_hub_download
 from kokoro_onnx import Kokoro
-from onnxruntime import InferenceSession, get_available_providers
+from onnxruntime import (
+    ExecutionMode,
+    GraphOptimizationLevel,
+    InferenceSession,
+    RunOptions,
+    SessionOptions,
+    get_available_providers,
+)
 
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for the CUDA arena; without it ORT grows the arena to peak
+# demand and never gives the memory back.
+_GPU_MEM_LIMIT_BYTES = int(os.environ.get("TTS_GPU_MEM_LIMIT_MB", "2048")) * 1024 * 1024
+
+_CUDA_PROVIDER_OPTIONS = {
+    # Grow the arena by what was asked for instead of doubling, so spikes
+    # from long inputs do not permanently inflate GPU usage.
+    "arena_extend_strategy": "kSameAsRequested",
+    # Heuristic conv algo search skips the expensive exhaustive sweep on
+    # first inference for each shape.
+    "cudnn_conv_algo_search": "HEURISTIC",
+    # Let cuDNN consider algorithms needing larger scratch space; the
+    # faster convs it unlocks matter more than the transient workspace,
+    # which the arena reuses across calls anyway.
+    "cudnn_conv_use_max_workspace": "1",
+    "gpu_mem_limit": str(_GPU_MEM_LIMIT_BYTES),
+    "do_copy_in_default_stream": "1",
+}
+
+_COREML_PROVIDER_OPTIONS = {
+    "MLComputeUnits": "ALL",
+    "ModelFormat": "MLProgram",
+}
+
+_TRT_PROVIDER_OPTIONS = {
+    "trt_fp16_enable": "1",
+    # Building the engine takes minutes; cache it on disk so only the
+    # first load on a given host pays, and reloads after a TTL unload
+    # just deserialize.
+    "trt_engine_cache_enable": "1",
+    "trt_engine_cache_path": os.path.expanduser("~/.cache/kokoro-trt"),
+    "trt_max_workspace_size": str(2 * 1024**3),
+}
+
 
 def _get_onnx_providers(device: str) -> list[tuple[str, dict]]:
     available = get_available_providers()
@@ -32,16 +77,188 @@ def _get_onnx_providers(device: str) -> list[tuple[str, dict]]:
     providers = []
 
     if system == "Darwin" and machine == "arm64" and "CoreMLExecutionProvider" in available:
-        providers.append(("CoreMLExecutionProvider", {}))
+        providers.append(("CoreMLExecutionProvider", _COREML_PROVIDER_OPTIONS))
+
+    # TensorRT sits above CUDA when present: it fuses the conv/norm chains
+    # of the acoustic model into single Tensor Core kernels, and anything
+    # it cannot build an engine for falls through to the CUDA EP below.
+    if "TensorrtExecutionProvider" in available:
+        os.makedirs(_TRT_PROVIDER_OPTIONS["trt_engine_cache_path"], exist_ok=True)
+        providers.append(("TensorrtExecutionProvider", _TRT_PROVIDER_OPTIONS))
 
     if "CUDAExecutionProvider" in available:
-        providers.append(("CUDAExecutionProvider", {}))
+        providers.append(("CUDAExecutionProvider", _CUDA_PROVIDER_OPTIONS))
 
     providers.append(("CPUExecutionProvider", {}))
 
     logger.info(f"Using ONNX providers: {providers}")
     return providers
 
+
+def _new_session_options(providers: list[tuple[str, dict]]) -> SessionOptions:
+    options = SessionOptions()
+    options.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_ALL
+    # Memory-pattern planning assumes static shapes; with variable-length
+    # TTS inputs it interacts with the CUDA arena to produce monotonic
+    # memory growth, so disable it when CUDA is in play.
+    if any(name == "CUDAExecutionProvider" for name, _ in providers):
+        options.enable_mem_pattern = False
+    else:
+        # Kokoro's decoder has independent upsampler/iSTFT branches that
+        # serialize under the default sequential mode; a small inter-op
+        # pool lets them run concurrently on CPU. Intra-op keeps the bulk
+        # of the cores for the heavy convs. Under CUDA the branches already
+        # overlap on the stream, so parallel execution would only add
+        # copy contention there.
+        options.execution_mode = ExecutionMode.ORT_PARALLEL
+        options.inter_op_num_threads = 2
+        options.intra_op_num_threads = max(1, (os.cpu_count() or 1) // 2)
+    return options
+
+
+# Dynamic int8 quantization roughly halves CPU inference cost for the
+# fallback path; disable with TTS_QUANTIZE_CPU=0 if fidelity matters more.
+_QUANTIZE_CPU = os.environ.get("TTS_QUANTIZE_CPU", "1").lower() not in ("0", "false")
+
+
+def _quantized_model_path(model_path: str) -> str:
+    key = hashlib.sha1(model_path.encode()).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"kokoro_{key}.int8.onnx")
+
+
+def _maybe_quantize_int8(model_path: str) -> str:
+    """Return an int8-quantized copy of the model for CPU inference.
+
+    Falls back to the original path when the quantization tooling is not
+    installed or conversion fails; the quantized file is cached so the
+    one-time conversion cost is only paid on the first CPU load.
+    """
+    out_path = _quantized_model_path(model_path)
+    if os.path.exists(out_path):
+        return out_path
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        logger.debug("onnxruntime.quantization unavailable, using fp32 model on CPU")
+        return model_path
+    try:
+        logger.info("Quantizing Kokoro model to int8 for CPU inference")
+        quantize_dynamic(model_path, out_path, weight_type=QuantType.QInt8)
+    except Exception as e:
+        logger.warning(f"int8 quantization failed, using fp32 model: {e}")
+        if os.path.exists(out_path):
+            os.remove(out_path)
+        return model_path
+    return out_path
+
+
+# fp16 weights on CUDA double Tensor Core math throughput and halve the
+# weight/activation bandwidth; disable with TTS_FP16=0 if fidelity matters
+# more.
+_FP16_CUDA = os.environ.get("TTS_FP16", "1").lower() not in ("0", "false")
+
+
+def _fp16_model_path(model_path: str) -> str:
+    key = hashlib.sha1(model_path.encode()).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"kokoro_{key}.fp16.onnx")
+
+
+def _maybe_convert_fp16(model_path: str) -> str:
+    """Return an fp16-weight copy of the model for CUDA inference.
+
+    keep_io_types leaves the token/style inputs and audio output as fp32,
+    so callers are unchanged while the internal matmuls and convs run in
+    half precision. Falls back to the original path when the converter is
+    not installed or conversion fails; the converted file is cached so the
+    one-time cost is only paid on the first CUDA load.
+    """
+    out_path = _fp16_model_path(model_path)
+    if os.path.exists(out_path):
+        return out_path
+    try:
+        import onnx
+        from onnxconverter_common import float16
+    except ImportError:
+        logger.debug("onnxconverter-common unavailable, using fp32 model on CUDA")
+        return model_path
+    try:
+        logger.info("Converting Kokoro model to fp16 for CUDA inference")
+        model = float16.convert_float_to_float16(onnx.load(model_path), keep_io_types=True)
+        onnx.save(model, out_path)
+    except Exception as e:
+        logger.warning(f"fp16 conversion failed, using fp32 model: {e}")
+        if os.path.exists(out_path):
+            os.remove(out_path)
+        return model_path
+    return out_path
+
+
+def _optimized_model_path(model_path: str, device: str) -> str:
+    key = hashlib.sha1(f"{model_path}:{device}".encode()).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"kokoro_{key}.opt.onnx")
+
+
+def _create_session(model_path: str, providers: list[tuple[str, dict]], device: str) -> InferenceSession:
+    # Serialize the optimized graph next to the temp dir on first load so
+    # reloads after a TTL unload skip graph optimization and just mmap the
+    # prepared model. The cache is keyed on model path + device because the
+    # optimized graph is provider-specific.
+    options = _new_session_options(providers)
+    opt_path = _optimized_model_path(model_path, device)
+    if os.path.exists(opt_path):
+        try:
+            return InferenceSession(opt_path, sess_options=options, providers=providers)
+        except Exception as e:
+            logger.warning(f"Cached optimized model unusable, rebuilding: {e}")
+    options.optimized_model_filepath = opt_path
+    return InferenceSession(model_path, sess_options=options, providers=providers)
+
+
+def _dummy_feeds(session: InferenceSession) -> dict[str, np.ndarray]:
+    feeds = {}
+    for inp in session.get_inputs():
+        shape = [dim if isinstance(dim, int) else 1 for dim in inp.shape]
+        dtype = np.int64 if "int64" in inp.type else np.float32
+        feeds[inp.name] = np.zeros(shape, dtype=dtype)
+    return feeds
+
+
+def _warmup_session(session: InferenceSession) -> None:
+    """Run one minimal inference so the provider's memory arena and kernel
+    caches (e.g. cudnn conv-algo search) are populated at load time rather
+    than on the first user request. Kokoro owns the session internally, so
+    per-chunk IoBinding is not reachable from here; warming the arena is
+    what keeps first-chunk latency stable."""
+    try:
+        session.run(None, _dummy_feeds(session))
+    except Exception as e:
+        logger.debug(f"Session warmup skipped: {e}")
+
+
+# Voice style vectors shared process-wide: Kokoro's own loader keeps the
+# archive lazy, re-reading it on every style lookup, and each instance
+# (CUDA, CPU fallback, TTL reloads) would otherwise load its own copy.
+_voices_cache: dict[str, dict[str, np.ndarray]] = {}
+
+
+def _shared_voices(voices_path: str) -> dict[str, np.ndarray]:
+    voices = _voices_cache.get(voices_path)
+    if voices is None:
+        data = np.load(voices_path)
+        if hasattr(data, "files"):
+            voices = {name: data[name] for name in data.files}
+            data.close()
+        else:
+            voices = data
+        _voices_cache[voices_path] = voices
+    return voices
+
+
+# A run carrying this option asks the CUDA arena to hand free chunks back
+# to the driver; used to shrink VRAM while a model idles below its TTL.
+_SHRINK_RUN_OPTIONS = RunOptions()
+_SHRINK_RUN_OPTIONS.add_run_config_entry("memory.enable_memory_arena_shrinkage", "gpu:0")
+
 SAMPLE_RATE = 24000
 
 KOKORO_VOICES = [
@@ -100,6 +317,11 @@ KOKORO_VOICES = [
     ("pm_santa", "pt", "male"),
 ]
 
+# get_voice_lang runs once per synthesis request; probe a dict built at
+# import instead of scanning the tuple list each time.
+_VOICE_LANG: dict[str, str] = {name: lang for name, lang, _ in KOKORO_VOICES}
+_VOICE_LIST: list[str] = [name for name, _, _ in KOKORO_VOICES]
+
 
 @dataclass
 class TTSConfig:
@@ -121,37 +343,63 @@ class KokoroModelManager:
         self.config = config
         self._kokoro: Kokoro | None = None
         self._cpu_kokoro: Kokoro | None = None
-        self._sync_lock = threading.RLock()
-        self._async_lock: asyncio.Lock | None = None
+        self._session: InferenceSession | None = None
+        self._sync_lock = threading.Lock()
+        # Separate locks so a CPU-fallback load is not serialized behind a
+        # cold GPU download/load holding one shared lock for minutes.
+        self._gpu_lock = asyncio.Lock()
+        self._cpu_lock = asyncio.Lock()
         self._model_path: str | None = None
         self._voices_path: str | None = None
         self._last_used: float = 0
         self._cleanup_task: asyncio.Task | None = None
         self._cleanup_interval: float = 30.0
-
-    def _get_async_lock(self) -> asyncio.Lock:
-        if self._async_lock is None:
-            self._async_lock = asyncio.Lock()
-        return self._async_lock
+        # All model ops run on one dedicated thread so the provider context
+        # (CUDA stream / CoreML) stays bound to a single OS thread instead
+        # of hopping around the shared default executor.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="kokoro")
 
     def _download_model_files_sync(self) -> tuple[str, str]:
         if self._model_path and self._voices_path:
             return self._model_path, self._voices_path
-        logger.info(f"Downloading model files from {self.config.model_id}")
-        self._model_path = hf_hub_download(self.config.model_id, "model.onnx")
-        self._voices_path = hf_hub_download(self.config.model_id, "voices.bin")
+        # Even with the files on disk, a plain hf_hub_download still makes a
+        # Hub round-trip to revalidate ETags; resolve from the local cache
+        # first and only go to the network on a cache miss.
+        try:
+            self._model_path = hf_hub_download(self.config.model_id, "model.onnx", local_files_only=True)
+            self._voices_path = hf_hub_download(self.config.model_id, "voices.bin", local_files_only=True)
+        except FileNotFoundError:
+            logger.info(f"Downloading model files from {self.config.model_id}")
+            self._model_path = hf_hub_download(self.config.model_id, "model.onnx")
+            self._voices_path = hf_hub_download(self.config.model_id, "voices.bin")
         return self._model_path, self._voices_path
 
     def _load_model_sync(self, model_path: str, voices_path: str) -> Kokoro:
         logger.info(f"Loading Kokoro model {self.config.model_id}")
         session_providers = _get_onnx_providers(self.config.device)
-        session = InferenceSession(model_path, providers=session_providers)
+        if self.config.device == "cpu" and _QUANTIZE_CPU:
+            model_path = _maybe_quantize_int8(model_path)
+        elif _FP16_CUDA and any(
+            name in ("CUDAExecutionProvider", "TensorrtExecutionProvider")
+            for name, _ in session_providers
+        ):
+            model_path = _maybe_convert_fp16(model_path)
+        session = _create_session(model_path, session_providers, self.config.device)
+        _warmup_session(session)
+        self._session = session
         kokoro = Kokoro.from_session(session, voices_path)
+        kokoro.voices = _shared_voices(voices_path)
         logger.info("Kokoro model loaded")
         return kokoro
 
     async def get_kokoro(self) -> Kokoro:
-        async with self._get_async_lock():
+        # Double-checked: once the reference is published the common case
+        # takes no lock at all.
+        if self._kokoro is not None:
+            self._last_used = time.monotonic()
+            return self._kokoro
+
+        async with self._gpu_lock:
             if self._kokoro is not None:
                 self._last_used = time.monotonic()
                 return self._kokoro
@@ -159,44 +407,72 @@ class KokoroModelManager:
             loop = asyncio.get_running_loop()
 
             model_path, voices_path = await loop.run_in_executor(
-                None, self._download_model_files_sync
+                self._executor, self._download_model_files_sync
             )
 
             self._kokoro = await loop.run_in_executor(
-                None, lambda: self._load_model_sync(model_path, voices_path)
+                self._executor, lambda: self._load_model_sync(model_path, voices_path)
             )
             self._last_used = time.monotonic()
             return self._kokoro
 
     async def get_cpu_model(self) -> Kokoro:
-        async with self._get_async_lock():
+        # On CPU-primary deployments the fallback would be a byte-for-byte
+        # duplicate of the primary session; reuse it instead of parsing the
+        # graph and loading the weights a second time.
+        if self.config.device == "cpu":
+            return await self.get_kokoro()
+
+        if self._cpu_kokoro is not None:
+            return self._cpu_kokoro
+
+        async with self._cpu_lock:
             if self._cpu_kokoro is not None:
                 return self._cpu_kokoro
 
             loop = asyncio.get_running_loop()
 
             model_path, voices_path = await loop.run_in_executor(
-                None, self._download_model_files_sync
+                self._executor, self._download_model_files_sync
             )
 
             logger.info("Loading Kokoro CPU fallback model")
-            session = await loop.run_in_executor(
-                None, lambda: InferenceSession(model_path, providers=[("CPUExecutionProvider", {})])
-            )
-            self._cpu_kokoro = await loop.run_in_executor(
-                None, lambda: Kokoro.from_session(session, voices_path)
-            )
+            cpu_providers = [("CPUExecutionProvider", {})]
+
+            def _load_cpu_session() -> InferenceSession:
+                path = _maybe_quantize_int8(model_path) if _QUANTIZE_CPU else model_path
+                return _create_session(path, cpu_providers, "cpu")
+
+            def _build_cpu_kokoro() -> Kokoro:
+                kokoro = Kokoro.from_session(session, voices_path)
+                kokoro.voices = _shared_voices(voices_path)
+                return kokoro
+
+            session = await loop.run_in_executor(self._executor, _load_cpu_session)
+            self._cpu_kokoro = await loop.run_in_executor(self._executor, _build_cpu_kokoro)
             logger.info("Kokoro CPU fallback model loaded")
             return self._cpu_kokoro
 
     def list_voices(self) -> list[str]:
-        return [v[0] for v in KOKORO_VOICES]
+        return list(_VOICE_LIST)
 
     def get_voice_lang(self, voice_id: str) -> str:
-        for name, lang, _ in KOKORO_VOICES:
-            if name == voice_id:
-                return lang
-        return "en-us"
+        return _VOICE_LANG.get(voice_id, "en-us")
+
+    @staticmethod
+    def _warmup_kokoro(kokoro: Kokoro) -> None:
+        """Synthesize one short utterance through the full pipeline.
+
+        The dummy-feed session warmup covers the provider's kernel and
+        arena setup, but the first real request still pays G2P/phonemizer
+        initialization and the style-vector lookup; a tiny end-to-end
+        create() at preload moves that off the first user-visible call.
+        """
+        try:
+            kokoro.create("warmup", voice=KOKORO_VOICES[0][0], speed=1.0, lang="en-us")
+            logger.info("Kokoro warmup synthesis completed")
+        except Exception as e:
+            logger.debug(f"Kokoro warmup synthesis skipped: {e}")
 
     def preload(self) -> None:
         with self._sync_lock:
@@ -205,6 +481,9 @@ class KokoroModelManager:
             model_path, voices_path = self._download_model_files_sync()
             self._kokoro = self._load_model_sync(model_path, voices_path)
             self._last_used = time.monotonic()
+            # Fire-and-forget on the model executor: startup is not blocked
+            # and the provider context stays on its dedicated thread.
+            self._executor.submit(self._warmup_kokoro, self._kokoro)
 
     def __enter__(self) -> Kokoro:
         with self._sync_lock:
@@ -220,19 +499,36 @@ class KokoroModelManager:
     def _unload_kokoro(self) -> None:
         if self._kokoro is not None:
             self._kokoro = None
+            self._session = None
             logger.info("Unloaded TTS model due to TTL")
 
+    def _shrink_arena(self) -> None:
+        session = self._session
+        if session is None:
+            return
+        try:
+            session.run(None, _dummy_feeds(session), _SHRINK_RUN_OPTIONS)
+            logger.debug("CUDA arena shrinkage run completed")
+        except Exception as e:
+            logger.debug(f"Arena shrinkage skipped: {e}")
+
     async def _cleanup_loop(self) -> None:
         while True:
             await asyncio.sleep(self._cleanup_interval)
             now = time.monotonic()
 
             if self.config.ttl > 0 and self._kokoro is not None:
-                async with self._get_async_lock():
+                async with self._gpu_lock:
                     if self._kokoro is not None:
                         idle_time = now - self._last_used
                         if idle_time >= self.config.ttl:
                             self._unload_kokoro()
+                        elif self.config.device != "cpu" and idle_time >= self._cleanup_interval:
+                            # Still inside the TTL but idle: ask the CUDA
+                            # arena to release free blocks so VRAM is not
+                            # held at peak between requests.
+                            loop = asyncio.get_running_loop()
+                            await loop.run_in_executor(self._executor, self._shrink_arena)
 
     def start_cleanup_task(self) -> None:
         if self._cleanup_task is not None:
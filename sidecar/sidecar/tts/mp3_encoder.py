@@ -29,19 +29,23 @@ class StreamingMP3Encoder:
         self._encoder.set_quality(2)
         self._closed = False
 
-    def encode(self, pcm16: bytes) -> bytes:
+    def encode(self, pcm16: bytes | np.ndarray) -> bytes:
         if self._closed:
             return b""
 
-        samples = np.frombuffer(pcm16, dtype=np.int16)
-        return self._encoder.encode(samples.tobytes())
+        # lameenc reads the input through the buffer protocol and copies it
+        # during the call, so bytes and int16 ndarray scratch views both go
+        # straight in without a tobytes round-trip. The bytearray it hands
+        # back is normalized so callers can put the payload straight into
+        # protobuf fields.
+        return bytes(self._encoder.encode(pcm16))
 
     def flush(self) -> bytes:
         if self._closed:
             return b""
 
         self._closed = True
-        return self._encoder.flush()
+        return bytes(self._encoder.flush())
 
     def close(self) -> None:
         self._closed = True
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections import deque
 
 import numpy as np
 import soxr
@@ -27,42 +28,98 @@ class StreamingOpusEncoder:
         self._target_rate = target_rate
         self._channels = channels
         self._frame_samples = int(target_rate * OPUS_FRAME_MS / 1000)
-        self._buffer = np.array([], dtype=np.int16)
+        # Pending samples are kept as a deque of chunks with a running
+        # length; frames are assembled from the head on demand, so buffering
+        # stays O(1) amortized instead of re-concatenating the whole backlog
+        # on every call.
+        self._pending: deque[np.ndarray] = deque()
+        self._pending_len = 0
+        # One resampler for the whole stream: filter state carries across
+        # chunks (no edge artifacts at chunk boundaries) and soxr consumes
+        # int16 directly, skipping the float round-trip per call.
+        self._resampler: soxr.ResampleStream | None = None
+        if source_rate != target_rate:
+            self._resampler = soxr.ResampleStream(
+                source_rate, target_rate, channels, dtype="int16"
+            )
         self._encoder = opuslib.Encoder(target_rate, channels, "audio")
         self._closed = False
 
-    def encode(self, pcm16: bytes) -> list[bytes]:
+    def encode(self, pcm16: bytes | np.ndarray) -> list[bytes]:
         if self._closed:
             return []
 
-        samples = np.frombuffer(pcm16, dtype=np.int16)
+        # int16 ndarray views are accepted so callers can pass a reusable
+        # scratch buffer without a bytes copy; the resample path makes its
+        # own arrays and the pass-through path snapshots below.
+        samples = pcm16 if isinstance(pcm16, np.ndarray) else np.frombuffer(pcm16, dtype=np.int16)
 
-        if self._source_rate != self._target_rate:
-            float_samples = samples.astype(np.float32) / 32768.0
-            resampled = soxr.resample(float_samples, self._source_rate, self._target_rate)
-            samples = (resampled * 32768.0).clip(-32768, 32767).astype(np.int16)
+        if self._resampler is not None:
+            samples = self._resampler.resample_chunk(samples)
+            if len(samples) == 0:
+                return []
+        elif isinstance(pcm16, np.ndarray):
+            # The chunk is retained across calls, so scratch views handed in
+            # by the caller must be snapshotted.
+            samples = samples.copy()
 
-        self._buffer = np.concatenate([self._buffer, samples])
+        self._pending.append(samples)
+        self._pending_len += len(samples)
 
         frames = []
-        while len(self._buffer) >= self._frame_samples:
-            frame_data = self._buffer[:self._frame_samples].tobytes()
-            self._buffer = self._buffer[self._frame_samples:]
-            encoded = self._encoder.encode(frame_data, self._frame_samples)
+        while self._pending_len >= self._frame_samples:
+            frame = self._take_frame()
+            encoded = self._encoder.encode(frame.tobytes(), self._frame_samples)
             frames.append(encoded)
 
         return frames
 
+    def _take_frame(self) -> np.ndarray:
+        need = self._frame_samples
+        self._pending_len -= need
+
+        head = self._pending[0]
+        if len(head) >= need:
+            if len(head) == need:
+                self._pending.popleft()
+            else:
+                self._pending[0] = head[need:]
+            return head[:need]
+
+        parts = []
+        while need:
+            chunk = self._pending.popleft()
+            if len(chunk) <= need:
+                parts.append(chunk)
+                need -= len(chunk)
+            else:
+                parts.append(chunk[:need])
+                self._pending.appendleft(chunk[need:])
+                need = 0
+        return np.concatenate(parts)
+
     def flush(self) -> list[bytes]:
         if self._closed:
             return []
 
         frames = []
-        if len(self._buffer) > 0:
-            padded = np.pad(self._buffer, (0, self._frame_samples - len(self._buffer)))
+
+        if self._resampler is not None:
+            tail = self._resampler.resample_chunk(np.empty(0, dtype=np.int16), last=True)
+            if len(tail) > 0:
+                self._pending.append(tail)
+                self._pending_len += len(tail)
+            while self._pending_len >= self._frame_samples:
+                frame = self._take_frame()
+                frames.append(self._encoder.encode(frame.tobytes(), self._frame_samples))
+
+        if self._pending_len > 0:
+            tail = np.concatenate(self._pending) if len(self._pending) > 1 else self._pending[0]
+            self._pending.clear()
+            padded = np.pad(tail, (0, self._frame_samples - self._pending_len))
+            self._pending_len = 0
             encoded = self._encoder.encode(padded.tobytes(), self._frame_samples)
             frames.append(encoded)
-            self._buffer = np.array([], dtype=np.int16)
 
         self._closed = True
         return frames
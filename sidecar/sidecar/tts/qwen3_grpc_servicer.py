@@ -10,7 +10,8 @@ import grpc
 
 from sidecar.tts import pb2 as tts_pb2
 from sidecar.tts import pb2_grpc as tts_pb2_grpc
-from sidecar.tts.encoding import encode_audio_async
+from sidecar.tts.encoding import StreamingFileEncoder
+from sidecar.tts.grpc_servicer import swallow_warmup_result
 from sidecar.tts.mp3_encoder import StreamingMP3Encoder, has_native_mp3
 from sidecar.tts.opus_encoder import StreamingOpusEncoder, has_native_opus
 from sidecar.tts.qwen3_model_manager import SAMPLE_RATE, Qwen3ModelManager, Qwen3SynthesisConfig
@@ -29,6 +30,30 @@ class Qwen3TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer)
         self.model_manager = model_manager
         self.config = config
         self.executor = executor
+        self._synthesizers: dict[float, Qwen3Synthesizer] = {}
+        # Voices live in the manager's in-memory dict, so the response only
+        # changes through CreateVoice/DeleteVoice; cache it until then.
+        self._voices_response: tts_pb2.ListVoicesResponse | None = None
+        # The model catalog is static for the process lifetime.
+        self._models_response = tts_pb2.ListModelsResponse(models=[
+            tts_pb2.TTSModel(
+                id=self.model_manager.config.model_id,
+                name="Qwen3-TTS",
+                description="Qwen3 TTS model with voice cloning support",
+            ),
+        ])
+
+    def _get_synthesizer(self, speed: float) -> Qwen3Synthesizer:
+        # Qwen3Synthesizer holds only the manager and config, so instances
+        # are safely shared across concurrent requests; cache per speed
+        # instead of allocating a fresh config + synthesizer every session.
+        synthesizer = self._synthesizers.get(speed)
+        if synthesizer is None:
+            synth_config = self.config if speed == self.config.speed else Qwen3SynthesisConfig(speed=speed)
+            synthesizer = Qwen3Synthesizer(self.model_manager, synth_config)
+            if len(self._synthesizers) < 32:
+                self._synthesizers[speed] = synthesizer
+        return synthesizer
 
     async def _parse_tts_config(
         self, request_iterator
@@ -54,6 +79,10 @@ class Qwen3TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer)
                 if session_config.response_format:
                     response_format = session_config.response_format.lower()
 
+                # Overlap a cold model load with the client's text stream.
+                warm = asyncio.create_task(self.model_manager.get_model())
+                warm.add_done_callback(swallow_warmup_result)
+
                 logger.info(f"Qwen3 TTS session configured: voice={voice_id}")
                 continue
 
@@ -72,12 +101,12 @@ class Qwen3TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer)
         return session_config, text_chunks, voice_id, response_format, errors
 
     def _create_audio_chunk(
-        self, data: bytes | bytearray, format: str, audio_samples: int, transcript: str | None = None
+        self, data: bytes, format: str, audio_samples: int, transcript: str | None = None
     ) -> tts_pb2.TtsServerMessage:
         sample_rate = 48000 if format == "opus" else SAMPLE_RATE
         return tts_pb2.TtsServerMessage(
             audio=tts_pb2.AudioChunk(
-                data=bytes(data) if isinstance(data, bytearray) else data,
+                data=data,
                 format=format,
                 sample_rate=sample_rate,
                 timestamp_ms=int(audio_samples * 1000 / SAMPLE_RATE),
@@ -160,20 +189,27 @@ class Qwen3TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer)
             return
 
         speed = session_config.speed if session_config.speed > 0 else self.config.speed
-        synth_config = Qwen3SynthesisConfig(speed=speed)
-
-        synthesizer = Qwen3Synthesizer(self.model_manager, synth_config)
+        synthesizer = self._get_synthesizer(speed)
         stop_event = asyncio.Event()
+        # Propagate client disconnect/cancellation into the synthesizer so
+        # generation stops instead of running to completion for a stream
+        # nobody is reading.
+        context.add_done_callback(lambda _ctx: stop_event.set())
 
         start_time = time.perf_counter()
         audio_samples = 0
-        buffer = bytearray()
         stream_pcm = response_format == "pcm"
         stream_opus = response_format == "opus"
         stream_mp3 = response_format == "mp3"
 
         opus_encoder: StreamingOpusEncoder | None = None
         mp3_encoder: StreamingMP3Encoder | None = None
+        file_encoder: StreamingFileEncoder | None = None
+
+        if not (stream_pcm or stream_opus or stream_mp3):
+            # WAV/FLAC are encoded incrementally instead of buffering the
+            # whole utterance's PCM and encoding it in one shot at the end.
+            file_encoder = StreamingFileEncoder(SAMPLE_RATE, response_format)
 
         if stream_opus:
             if not has_native_opus():
@@ -210,8 +246,8 @@ class Qwen3TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer)
                     mp3_data = mp3_encoder.encode(pcm16)
                     if mp3_data:
                         yield self._create_audio_chunk(mp3_data, "mp3", audio_samples)
-                else:
-                    buffer.extend(pcm16)
+                elif file_encoder is not None:
+                    file_encoder.write(pcm16)
 
         except SynthesisError as e:
             logger.error(f"Qwen3 synthesis error: {e}")
@@ -219,6 +255,8 @@ class Qwen3TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer)
                 opus_encoder.close()
             if mp3_encoder is not None:
                 mp3_encoder.close()
+            if file_encoder is not None:
+                file_encoder.close()
             yield tts_pb2.TtsServerMessage(
                 error=tts_pb2.TtsError(message=str(e), code=e.code)
             )
@@ -230,6 +268,8 @@ class Qwen3TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer)
                 opus_encoder.close()
             if mp3_encoder is not None:
                 mp3_encoder.close()
+            if file_encoder is not None:
+                file_encoder.close()
             yield tts_pb2.TtsServerMessage(
                 error=tts_pb2.TtsError(message=f"Unexpected error: {e}", code=99)
             )
@@ -243,20 +283,23 @@ class Qwen3TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer)
             flush_data = mp3_encoder.flush()
             if flush_data:
                 yield self._create_audio_chunk(flush_data, "mp3", audio_samples, full_text)
-        elif not stream_pcm:
+        elif file_encoder is not None:
             try:
-                encoded, enc_format = await encode_audio_async(bytes(buffer), SAMPLE_RATE, response_format)
-                yield self._create_audio_chunk(encoded, enc_format, audio_samples, full_text)
-            except SynthesisError as e:
+                encoded = file_encoder.flush()
+                yield self._create_audio_chunk(encoded, response_format, audio_samples, full_text)
+            except Exception as e:
                 logger.error(f"Encoding error: {e}")
                 yield tts_pb2.TtsServerMessage(
-                    error=tts_pb2.TtsError(message=str(e), code=e.code)
+                    error=tts_pb2.TtsError(message=f"Encoding failed: {e}", code=5)
                 )
                 return
 
         yield self._create_done_message(audio_samples, start_time, full_text)
 
     def ListVoices(self, request, context):
+        if self._voices_response is not None:
+            return self._voices_response
+
         voices = []
         for voice_id in self.model_manager.list_voices():
             voice = self.model_manager.get_voice(voice_id)
@@ -267,17 +310,11 @@ class Qwen3TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer)
                     language=voice.language,
                     gender=voice.gender,
                 ))
-        return tts_pb2.ListVoicesResponse(voices=voices)
+        self._voices_response = tts_pb2.ListVoicesResponse(voices=voices)
+        return self._voices_response
 
     def ListModels(self, request, context):
-        models = [
-            tts_pb2.TTSModel(
-                id=self.model_manager.config.model_id,
-                name="Qwen3-TTS",
-                description="Qwen3 TTS model with voice cloning support",
-            ),
-        ]
-        return tts_pb2.ListModelsResponse(models=models)
+        return self._models_response
 
     def CreateVoice(self, request, context):
         if not request.voice_id:
@@ -304,6 +341,7 @@ class Qwen3TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer)
                 gender=request.gender or "neutral",
                 ref_text=request.reference_text,
             )
+            self._voices_response = None
 
             return tts_pb2.CreateVoiceResponse(
                 voice=tts_pb2.Voice(
@@ -326,6 +364,8 @@ class Qwen3TextToSpeechServiceServicer(tts_pb2_grpc.TextToSpeechServiceServicer)
             return tts_pb2.DeleteVoiceResponse(success=False)
 
         success = self.model_manager.delete_voice(request.voice_id)
+        if success:
+            self._voices_response = None
 
         if not success:
             context.set_code(grpc.StatusCode.NOT_FOUND)
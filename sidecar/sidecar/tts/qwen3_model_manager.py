@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import io
+import json
 import logging
 import os
+import tempfile
 import threading
 import time
 from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -22,6 +26,10 @@ logger = logging.getLogger(__name__)
 
 SAMPLE_RATE = 24000
 
+# Upper bound on cached speaker-conditioning entries; embeddings can live
+# on the GPU, so the cache must not grow with the number of voices.
+_CLONE_PROMPT_CACHE_MAX = 64
+
 
 @dataclass
 class ClonedVoice:
@@ -57,61 +65,157 @@ class Qwen3ModelManager:
         self.config = config
         self._model = None
         self._cpu_model = None
-        self._sync_lock = threading.RLock()
-        self._async_lock: asyncio.Lock | None = None
+        self._sync_lock = threading.Lock()
+        # Separate locks so a CPU-fallback load is not serialized behind a
+        # cold GPU load holding one shared lock.
+        self._gpu_lock = asyncio.Lock()
+        self._cpu_lock = asyncio.Lock()
         self._last_used: float = 0
         self._cleanup_task: asyncio.Task | None = None
         self._cleanup_interval: float = 30.0
+        # Model load and generation run on one dedicated thread so the CUDA
+        # context stays bound to a single OS thread.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="qwen3")
         self._cloned_voices: dict[str, ClonedVoice] = {}
+        # Speaker conditioning computed from the reference audio, cached per
+        # (voice, device) so repeat requests skip the audio encoder pass.
+        self._clone_prompts: dict[tuple[str, str], object] = {}
         self._voices_lock = threading.Lock()
 
         Path(self.config.voices_dir).mkdir(parents=True, exist_ok=True)
+        self._index_path = Path(self.config.voices_dir) / "index.json"
         self._load_saved_voices()
 
     def _load_saved_voices(self) -> None:
         voices_path = Path(self.config.voices_dir)
-        if not voices_path.exists():
-            return
 
-        for voice_dir in voices_path.iterdir():
-            if not voice_dir.is_dir():
-                continue
+        # All voice metadata lives in one index file, so startup is a single
+        # sequential read plus one memmap per voice instead of a meta.txt
+        # read and a ref.wav header decode for every voice directory. Opening
+        # directly instead of exists-then-read keeps it to one stat.
+        try:
+            entries = json.loads(self._index_path.read_text())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to read voice index, rescanning: {e}")
+        else:
+            for entry in entries:
+                voice = self._load_indexed_voice(voices_path, entry)
+                if voice is not None:
+                    self._cloned_voices[voice.voice_id] = voice
+                    logger.info(f"Loaded cloned voice: {voice.voice_id}")
+            return
 
-            meta_path = voice_dir / "meta.txt"
-            audio_path = voice_dir / "ref.wav"
+        voice_dirs = [d for d in voices_path.iterdir() if d.is_dir()]
+        if not voice_dirs:
+            return
 
-            if not meta_path.exists() or not audio_path.exists():
-                continue
+        # Pre-index layout: per-voice meta.txt files. The per-voice reads
+        # are independent disk round-trips; scanning them in parallel keeps
+        # this one-time migration at roughly one I/O latency instead of N
+        # sequential ones. The index is written once at the end and is the
+        # only thing read from then on.
+        with ThreadPoolExecutor(max_workers=min(8, len(voice_dirs))) as pool:
+            for voice in pool.map(self._load_voice_dir, voice_dirs):
+                if voice is not None:
+                    self._cloned_voices[voice.voice_id] = voice
+                    logger.info(f"Loaded cloned voice: {voice.voice_id}")
+
+        if self._cloned_voices:
+            self._write_index()
+
+    @staticmethod
+    def _load_indexed_voice(voices_path: Path, entry: dict) -> ClonedVoice | None:
+        try:
+            voice_id = entry["voice_id"]
+            raw_path = voices_path / voice_id / "ref.f32"
+            audio = np.memmap(str(raw_path), dtype=np.float32, mode="r")
+            channels = entry.get("channels", 1)
+            if channels > 1:
+                audio = audio.reshape(-1, channels)
+            return ClonedVoice(
+                voice_id=voice_id,
+                name=entry["name"],
+                language=entry["language"],
+                gender=entry["gender"],
+                ref_audio=audio,
+                ref_audio_sr=entry["samplerate"],
+                ref_text=entry["ref_text"],
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load indexed voice {entry.get('voice_id')}: {e}")
+            return None
 
+    def _write_index(self) -> None:
+        with self._voices_lock:
+            entries = [
+                {
+                    "voice_id": v.voice_id,
+                    "name": v.name,
+                    "language": v.language,
+                    "gender": v.gender,
+                    "ref_text": v.ref_text,
+                    "samplerate": v.ref_audio_sr,
+                    "channels": v.ref_audio.shape[1] if v.ref_audio.ndim > 1 else 1,
+                }
+                for v in self._cloned_voices.values()
+            ]
+        # Write-then-rename so a crash mid-write never leaves a truncated
+        # index behind.
+        fd, tmp_path = tempfile.mkstemp(dir=str(self._index_path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, str(self._index_path))
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def _load_voice_dir(voice_dir: Path) -> ClonedVoice | None:
+        meta_path = voice_dir / "meta.txt"
+        audio_path = voice_dir / "ref.wav"
+
+        try:
+            # Read directly and treat a missing file as "not a voice dir";
+            # probing with exists() first would just double the stat count.
+            lines = meta_path.read_text().strip().split("\n")
+            if len(lines) < 4:
+                return None
+
+            name, language, gender, ref_text = lines[0], lines[1], lines[2], lines[3]
+
+            # Memory-map the raw float32 twin of ref.wav so startup only
+            # reads metadata and a voice's samples page in when it is
+            # actually synthesized with. Voices saved before the raw file
+            # existed are converted once here.
+            info = sf.info(str(audio_path))
+            raw_path = voice_dir / "ref.f32"
             try:
-                lines = meta_path.read_text().strip().split("\n")
-                if len(lines) < 4:
-                    continue
-
-                voice_id = voice_dir.name
-                name = lines[0]
-                language = lines[1]
-                gender = lines[2]
-                ref_text = lines[3]
-
-                audio_data, sr = sf.read(str(audio_path))
-                self._cloned_voices[voice_id] = ClonedVoice(
-                    voice_id=voice_id,
-                    name=name,
-                    language=language,
-                    gender=gender,
-                    ref_audio=audio_data.astype(np.float32),
-                    ref_audio_sr=sr,
-                    ref_text=ref_text,
-                )
-                logger.info(f"Loaded cloned voice: {voice_id}")
-            except Exception as e:
-                logger.warning(f"Failed to load voice {voice_dir.name}: {e}")
-
-    def _get_async_lock(self) -> asyncio.Lock:
-        if self._async_lock is None:
-            self._async_lock = asyncio.Lock()
-        return self._async_lock
+                audio = np.memmap(str(raw_path), dtype=np.float32, mode="r")
+            except FileNotFoundError:
+                audio_data, _ = sf.read(str(audio_path), dtype="float32")
+                audio_data.tofile(str(raw_path))
+                audio = np.memmap(str(raw_path), dtype=np.float32, mode="r")
+            if info.channels > 1:
+                audio = audio.reshape(-1, info.channels)
+
+            return ClonedVoice(
+                voice_id=voice_dir.name,
+                name=name,
+                language=language,
+                gender=gender,
+                ref_audio=audio,
+                ref_audio_sr=info.samplerate,
+                ref_text=ref_text,
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to load voice {voice_dir.name}: {e}")
+            return None
 
     def _load_model_sync(self, device: str = None):
         if device is None:
@@ -123,34 +227,96 @@ class Qwen3ModelManager:
 
         dtype = torch.bfloat16 if device == "cuda" else torch.float32
 
-        model = Qwen3TTSModel.from_pretrained(
-            self.config.model_id,
-            device_map=device,
-            dtype=dtype,
-        )
+        if device == "cuda":
+            # TF32 matmuls for whatever still runs in fp32; attention goes
+            # through flash/SDPA kernels selected below.
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.set_float32_matmul_precision("high")
+
+        # Prefer flash-attention on CUDA, then PyTorch SDPA; either cuts the
+        # HBM traffic of long-context decode. Fall back to the wrapper's
+        # default when flash-attn is not installed or the kwarg is not
+        # forwarded.
+        model = None
+        attn_candidates = ("flash_attention_2", "sdpa") if device == "cuda" else ("sdpa",)
+        for attn in attn_candidates:
+            try:
+                model = Qwen3TTSModel.from_pretrained(
+                    self.config.model_id,
+                    device_map=device,
+                    dtype=dtype,
+                    attn_implementation=attn,
+                )
+                break
+            except (ImportError, ValueError) as e:
+                logger.debug(f"attn_implementation={attn} unavailable: {e}")
+            except TypeError:
+                break
+
+        if model is None:
+            model = Qwen3TTSModel.from_pretrained(
+                self.config.model_id,
+                device_map=device,
+                dtype=dtype,
+            )
+
+        if device == "cuda":
+            self._accelerate_cuda_decode(model)
 
         logger.info(f"Qwen3-TTS model loaded on {device}")
         return model
 
+    @staticmethod
+    def _accelerate_cuda_decode(model) -> None:
+        """Best effort: static KV cache plus torch.compile for the decoder.
+
+        generate_voice_clone drives an autoregressive transformers decode;
+        pinning the cache implementation to "static" keeps KV shapes fixed
+        so a reduce-overhead compile can capture the decoder step once
+        instead of re-specializing every call. The wrapper owns the decode
+        loop itself, so this only touches the inner model when it is
+        exposed, and anything unexpected leaves the eager path in place.
+        """
+        inner = getattr(model, "model", model)
+        try:
+            gen_config = getattr(inner, "generation_config", None)
+            if gen_config is not None:
+                gen_config.cache_implementation = "static"
+            inner.forward = torch.compile(
+                inner.forward, mode="reduce-overhead", dynamic=False
+            )
+            logger.info("Compiled Qwen3-TTS decoder (static KV cache)")
+        except Exception as e:
+            logger.warning("torch.compile unavailable for Qwen3-TTS, keeping eager decode: %s", e)
+
     async def get_model(self):
-        async with self._get_async_lock():
+        # Double-checked: once the reference is published the common case
+        # takes no lock at all.
+        if self._model is not None:
+            self._last_used = time.monotonic()
+            return self._model
+
+        async with self._gpu_lock:
             if self._model is not None:
                 self._last_used = time.monotonic()
                 return self._model
 
             loop = asyncio.get_running_loop()
-            self._model = await loop.run_in_executor(None, self._load_model_sync)
+            self._model = await loop.run_in_executor(self._executor, self._load_model_sync)
             self._last_used = time.monotonic()
             return self._model
 
     async def get_cpu_model(self):
-        async with self._get_async_lock():
+        if self._cpu_model is not None:
+            return self._cpu_model
+
+        async with self._cpu_lock:
             if self._cpu_model is not None:
                 return self._cpu_model
 
             loop = asyncio.get_running_loop()
             self._cpu_model = await loop.run_in_executor(
-                None, lambda: self._load_model_sync("cpu")
+                self._executor, lambda: self._load_model_sync("cpu")
             )
             return self._cpu_model
 
@@ -175,8 +341,9 @@ class Qwen3ModelManager:
         gender: str,
         ref_text: str,
     ) -> ClonedVoice:
-        audio_array, sr = sf.read(io.BytesIO(audio_data))
-        audio_array = audio_array.astype(np.float32)
+        # Decode straight to float32; the default float64 read would cost a
+        # double-width buffer plus an astype copy just to narrow it again.
+        audio_array, sr = sf.read(io.BytesIO(audio_data), dtype="float32")
 
         voice = ClonedVoice(
             voice_id=voice_id,
@@ -192,10 +359,14 @@ class Qwen3ModelManager:
         voice_dir.mkdir(parents=True, exist_ok=True)
 
         sf.write(str(voice_dir / "ref.wav"), audio_array, sr)
+        # Raw float32 twin of ref.wav; _load_saved_voices memory-maps it
+        # instead of decoding and holding every voice's audio in RAM.
+        audio_array.tofile(str(voice_dir / "ref.f32"))
         (voice_dir / "meta.txt").write_text(f"{name}\n{language}\n{gender}\n{ref_text}")
 
         with self._voices_lock:
             self._cloned_voices[voice_id] = voice
+        self._write_index()
 
         logger.info(f"Created cloned voice: {voice_id}")
         return voice
@@ -205,10 +376,14 @@ class Qwen3ModelManager:
             if voice_id not in self._cloned_voices:
                 return False
             del self._cloned_voices[voice_id]
+            for key in [k for k in self._clone_prompts if k[0] == voice_id]:
+                del self._clone_prompts[key]
+
+        self._write_index()
 
         voice_dir = Path(self.config.voices_dir) / voice_id
-        if voice_dir.exists():
-            import shutil
+        import shutil
+        with contextlib.suppress(FileNotFoundError):
             shutil.rmtree(voice_dir)
 
         logger.info(f"Deleted cloned voice: {voice_id}")
@@ -237,13 +412,12 @@ class Qwen3ModelManager:
         loop = asyncio.get_running_loop()
 
         ref_audio_tuple = (voice.ref_audio, voice.ref_audio_sr)
+        device_key = "cpu" if use_cpu else self.config.device
 
         def _generate():
-            wavs, sr = model.generate_voice_clone(
+            gen_kwargs = dict(
                 text=text,
                 language=voice.language,
-                ref_audio=ref_audio_tuple,
-                ref_text=voice.ref_text,
                 max_new_tokens=2048,
                 do_sample=True,
                 top_k=50,
@@ -251,24 +425,80 @@ class Qwen3ModelManager:
                 temperature=0.9,
                 repetition_penalty=1.05,
             )
-            return wavs[0] if isinstance(wavs, list) else wavs, sr
+            prompt = self._voice_clone_prompt(model, voice, device_key)
+            if prompt is not None:
+                try:
+                    wavs, sr = model.generate_voice_clone(
+                        voice_clone_prompt=prompt, **gen_kwargs
+                    )
+                except TypeError:
+                    # The wrapper can precompute prompts but this release's
+                    # generate does not accept them; fall back below.
+                    prompt = None
+            if prompt is None:
+                wavs, sr = model.generate_voice_clone(
+                    ref_audio=ref_audio_tuple,
+                    ref_text=voice.ref_text,
+                    **gen_kwargs,
+                )
+            audio = wavs[0] if isinstance(wavs, list) else wavs
+            if isinstance(audio, torch.Tensor):
+                # Device-to-host copy happens here on the worker thread,
+                # not on the event loop.
+                audio = audio.detach().cpu().numpy()
+            audio = np.asarray(audio, dtype=np.float32)
+            if audio.ndim > 1:
+                audio = audio.squeeze()
+            return audio, sr
+
+        audio, sr = await loop.run_in_executor(self._executor, _generate)
+
+        # The whole utterance is already one float32 array; yield views
+        # into it instead of re-copying every chunk.
+        chunk_size = sr // 4
+        for i in range(0, len(audio), chunk_size):
+            yield audio[i:i + chunk_size]
 
-        audio, sr = await loop.run_in_executor(None, _generate)
+    def _voice_clone_prompt(self, model, voice: ClonedVoice, device_key: str):
+        """Return cached speaker conditioning for a voice, when supported.
 
-        if isinstance(audio, torch.Tensor):
-            audio = audio.cpu().numpy()
+        generate_voice_clone re-encodes the reference audio on every call;
+        wrapper releases that expose create_voice_clone_prompt let that
+        encoder pass run once per voice and device instead. Returns None
+        when the model cannot precompute, keeping the raw-reference path.
+        """
+        if not hasattr(model, "create_voice_clone_prompt"):
+            return None
 
-        if audio.ndim > 1:
-            audio = audio.squeeze()
+        key = (voice.voice_id, device_key)
+        with self._voices_lock:
+            prompt = self._clone_prompts.get(key)
+        if prompt is not None:
+            return prompt
 
-        chunk_size = sr // 4
-        for i in range(0, len(audio), chunk_size):
-            yield audio[i:i + chunk_size].astype(np.float32)
+        try:
+            prompt = model.create_voice_clone_prompt(
+                ref_audio=(voice.ref_audio, voice.ref_audio_sr),
+                ref_text=voice.ref_text,
+            )
+        except Exception as e:
+            logger.warning(f"Voice clone prompt precompute failed for {voice.voice_id}: {e}")
+            return None
+
+        with self._voices_lock:
+            if len(self._clone_prompts) >= _CLONE_PROMPT_CACHE_MAX:
+                # Evict the oldest entry; dicts iterate in insertion order.
+                self._clone_prompts.pop(next(iter(self._clone_prompts)))
+            self._clone_prompts[key] = prompt
+        return prompt
 
     def _unload_model(self) -> None:
         if self._model is not None:
             del self._model
             self._model = None
+            # Cached prompts may hold tensors on the unloaded model's device.
+            with self._voices_lock:
+                self._clone_prompts.clear()
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
             logger.info("Unloaded Qwen3-TTS model due to TTL")
@@ -279,11 +509,15 @@ class Qwen3ModelManager:
             now = time.monotonic()
 
             if self.config.ttl > 0 and self._model is not None:
-                async with self._get_async_lock():
+                async with self._gpu_lock:
                     if self._model is not None:
                         idle_time = now - self._last_used
                         if idle_time >= self.config.ttl:
                             self._unload_model()
+                        elif idle_time >= self._cleanup_interval and torch.cuda.is_available():
+                            # Idle but still within the TTL: return cached
+                            # CUDA blocks to the driver without unloading.
+                            torch.cuda.empty_cache()
 
     def start_cleanup_task(self) -> None:
         if self._cleanup_task is not None:
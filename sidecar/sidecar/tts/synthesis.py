@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import threading
 import time
 from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Protocol
@@ -55,36 +57,68 @@ class Synthesizer:
         start = time.perf_counter()
         used_cpu_fallback = False
 
-        for text_chunk in text_chunks:
-            if stop_event and stop_event.is_set():
-                break
+        def _begin(kokoro, chunk: str):
+            # Kick off a chunk's stream and schedule its first batch right
+            # away, so the model is already synthesizing chunk N+1 while
+            # chunk N's audio is still being streamed out. The ONNX export
+            # takes a single utterance per run, so chunks overlap through
+            # pipelining rather than a batch dimension.
+            stream = kokoro.create_stream(chunk, voice_id, lang=voice_lang, speed=speed)
+            return stream, asyncio.ensure_future(anext(stream))
+
+        pending = None
+        try:
+            for i, text_chunk in enumerate(text_chunks):
+                if stop_event and stop_event.is_set():
+                    break
+
+                try:
+                    kokoro = await self.model_manager.get_kokoro()
+
+                    if pending is None:
+                        pending = _begin(kokoro, text_chunk)
+                    stream, first = pending
+                    pending = None
+                    if i + 1 < len(text_chunks):
+                        pending = _begin(kokoro, text_chunks[i + 1])
 
-            try:
-                kokoro = await self.model_manager.get_kokoro()
-
-                async for audio_chunk, _ in kokoro.create_stream(
-                    text_chunk, voice_id, lang=voice_lang, speed=speed
-                ):
-                    if stop_event and stop_event.is_set():
-                        break
-                    yield audio_chunk
-
-            except Exception as e:
-                if is_oom_error(e) and self.model_manager.config.fallback_to_cpu:
-                    logger.warning(f"TTS OOM error, using CPU for this request: {e}")
-                    used_cpu_fallback = True
                     try:
-                        cpu_kokoro = await self.model_manager.get_cpu_model()
-                        async for audio_chunk, _ in cpu_kokoro.create_stream(
-                            text_chunk, voice_id, lang=voice_lang, speed=speed
-                        ):
+                        upcoming = first
+                        while True:
+                            audio_chunk, _ = await upcoming
                             if stop_event and stop_event.is_set():
                                 break
                             yield audio_chunk
-                    except Exception as cpu_e:
-                        raise SynthesisError(f"CPU fallback synthesis failed: {cpu_e}", code=3) from cpu_e
-                else:
-                    raise SynthesisError(f"Synthesis failed: {e}", code=3) from e
+                            upcoming = anext(stream)
+                    except StopAsyncIteration:
+                        pass
+                    finally:
+                        await stream.aclose()
+
+                except Exception as e:
+                    if is_oom_error(e) and self.model_manager.config.fallback_to_cpu:
+                        logger.warning(f"TTS OOM error, using CPU for this request: {e}")
+                        used_cpu_fallback = True
+                        try:
+                            cpu_kokoro = await self.model_manager.get_cpu_model()
+                            async for audio_chunk, _ in cpu_kokoro.create_stream(
+                                text_chunk, voice_id, lang=voice_lang, speed=speed
+                            ):
+                                if stop_event and stop_event.is_set():
+                                    break
+                                yield audio_chunk
+                        except Exception as cpu_e:
+                            raise SynthesisError(f"CPU fallback synthesis failed: {cpu_e}", code=3) from cpu_e
+                    else:
+                        raise SynthesisError(f"Synthesis failed: {e}", code=3) from e
+        finally:
+            if pending is not None:
+                stream, first = pending
+                first.cancel()
+                with contextlib.suppress(Exception):
+                    await first
+                with contextlib.suppress(Exception):
+                    await stream.aclose()
 
         device = "CPU" if used_cpu_fallback else "GPU"
         logger.info(f"Synthesized {len(text)} chars ({len(text_chunks)} chunks) in {time.perf_counter() - start:.2f}s on {device}")
@@ -115,39 +149,159 @@ class Qwen3Synthesizer:
         start = time.perf_counter()
         used_cpu_fallback = False
 
-        for text_chunk in text_chunks:
-            if stop_event and stop_event.is_set():
-                break
-
-            try:
-                async for audio_chunk in self.model_manager.synthesize_stream(
-                    text_chunk, voice_id, speed=speed, use_cpu=False
-                ):
-                    if stop_event and stop_event.is_set():
-                        break
-                    yield audio_chunk
-
-            except Exception as e:
-                if is_oom_error(e) and self.model_manager.config.fallback_to_cpu:
-                    logger.warning(f"Qwen3 TTS OOM error, using CPU for this request: {e}")
-                    used_cpu_fallback = True
+        def _begin(chunk: str):
+            # generate_voice_clone only hands back audio once the whole
+            # utterance is decoded, so chunk N+1's generation is kicked off
+            # while chunk N's audio is still being streamed out; that
+            # overlap is where the time-to-audio win comes from.
+            stream = self.model_manager.synthesize_stream(
+                chunk, voice_id, speed=speed, use_cpu=False
+            )
+            return stream, asyncio.ensure_future(anext(stream))
+
+        pending = None
+        try:
+            for i, text_chunk in enumerate(text_chunks):
+                if stop_event and stop_event.is_set():
+                    break
+
+                try:
+                    if pending is None:
+                        pending = _begin(text_chunk)
+                    stream, first = pending
+                    pending = None
+                    if i + 1 < len(text_chunks):
+                        pending = _begin(text_chunks[i + 1])
+
                     try:
-                        async for audio_chunk in self.model_manager.synthesize_stream(
-                            text_chunk, voice_id, speed=speed, use_cpu=True
-                        ):
+                        upcoming = first
+                        while True:
+                            audio_chunk = await upcoming
                             if stop_event and stop_event.is_set():
                                 break
                             yield audio_chunk
-                    except Exception as cpu_e:
-                        raise SynthesisError(f"CPU fallback synthesis failed: {cpu_e}", code=3) from cpu_e
-                else:
-                    raise SynthesisError(f"Qwen3 synthesis failed: {e}", code=3) from e
+                            upcoming = anext(stream)
+                    except StopAsyncIteration:
+                        pass
+                    finally:
+                        await stream.aclose()
+
+                except Exception as e:
+                    if is_oom_error(e) and self.model_manager.config.fallback_to_cpu:
+                        logger.warning(f"Qwen3 TTS OOM error, using CPU for this request: {e}")
+                        used_cpu_fallback = True
+                        try:
+                            async for audio_chunk in self.model_manager.synthesize_stream(
+                                text_chunk, voice_id, speed=speed, use_cpu=True
+                            ):
+                                if stop_event and stop_event.is_set():
+                                    break
+                                yield audio_chunk
+                        except Exception as cpu_e:
+                            raise SynthesisError(f"CPU fallback synthesis failed: {cpu_e}", code=3) from cpu_e
+                    else:
+                        raise SynthesisError(f"Qwen3 synthesis failed: {e}", code=3) from e
+        finally:
+            if pending is not None:
+                stream, first = pending
+                first.cancel()
+                with contextlib.suppress(Exception):
+                    await first
+                with contextlib.suppress(Exception):
+                    await stream.aclose()
 
         device = "CPU" if used_cpu_fallback else "GPU"
         logger.info(f"Qwen3 synthesized {len(text)} chars ({len(text_chunks)} chunks) in {time.perf_counter() - start:.2f}s on {device}")
 
 
+_tls = threading.local()
+
+# Optional fused clip+scale+cast kernel: one pass over the floats writing
+# straight into the int16 scratch, instead of NumPy's clip/multiply/cast
+# sequence. Numba is not a hard dependency; without it the NumPy path below
+# is used.
+try:
+    import numba
+
+    @numba.njit(cache=True, fastmath=True, boundscheck=False)
+    def _f32_to_pcm16_fused(src, dst) -> None:
+        for i in range(src.shape[0]):
+            v = src[i]
+            if v < -1.0:
+                v = -1.0
+            elif v > 1.0:
+                v = 1.0
+            dst[i] = np.int16(round(v * 32767.0))
+
+    @numba.njit(cache=True, fastmath=True, boundscheck=False, parallel=True)
+    def _f32_to_pcm16_fused_par(src, dst) -> None:
+        for i in numba.prange(src.shape[0]):
+            v = src[i]
+            if v < -1.0:
+                v = -1.0
+            elif v > 1.0:
+                v = 1.0
+            dst[i] = np.int16(round(v * 32767.0))
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+else:
+    try:
+        # Compile (or load the on-disk cache of) the kernels at import so
+        # the first synthesized chunk does not pay the JIT cost.
+        _f32_to_pcm16_fused(np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.int16))
+        _f32_to_pcm16_fused_par(np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.int16))
+    except Exception:
+        _HAS_NUMBA = False
+
+# Below this the thread fan-out costs more than the conversion itself;
+# Kokoro batches of several seconds of audio clear it comfortably.
+_PARALLEL_MIN_SAMPLES = 1 << 16
+
+
+def float32_to_pcm16_scratch(audio: np.ndarray) -> np.ndarray:
+    """Convert float32 audio to int16 in the per-thread scratch buffer.
+
+    The returned view stays valid only until the next conversion on the
+    same thread; callers that hold PCM across iterations should use
+    float32_to_pcm16 instead.
+    """
+    audio = np.asarray(audio, dtype=np.float32)
+    n = audio.shape[0]
+    scratch = getattr(_tls, "pcm16", None)
+    if scratch is None or scratch.shape[0] < n:
+        scratch = _tls.pcm16 = np.empty(max(n, 8192), dtype=np.int16)
+    out = scratch[:n]
+
+    if _HAS_NUMBA and audio.flags.c_contiguous:
+        if n >= _PARALLEL_MIN_SAMPLES:
+            _f32_to_pcm16_fused_par(audio, out)
+        else:
+            _f32_to_pcm16_fused(audio, out)
+        return out
+
+    # Clip and scale in place: synthesis chunks are freshly allocated, so
+    # mutating them saves two temporaries on this memory-bound path. The
+    # int16 result lands in the reusable per-thread scratch, so NumPy's
+    # vectorized cast is the last pass and nothing is allocated per chunk.
+    # Read-only inputs are staged through a per-thread float scratch rather
+    # than a fresh copy.
+    if not audio.flags.writeable:
+        fscratch = getattr(_tls, "f32", None)
+        if fscratch is None or fscratch.shape[0] < n:
+            fscratch = _tls.f32 = np.empty(max(n, 8192), dtype=np.float32)
+        staged = fscratch[:n]
+        np.copyto(staged, audio)
+        audio = staged
+    np.clip(audio, -1.0, 1.0, out=audio)
+    audio *= 32767.0
+    # Round to nearest before the int16 cast; a bare cast truncates toward
+    # zero, which biases the waveform by up to half an LSB.
+    np.rint(audio, out=audio)
+    out[:] = audio
+    return out
+
+
 def float32_to_pcm16(audio: np.ndarray) -> bytes:
-    audio = np.clip(audio, -1.0, 1.0)
-    pcm = (audio * 32767.0).astype(np.int16)
-    return pcm.tobytes()
+    return float32_to_pcm16_scratch(audio).tobytes()
@@ -1,4 +1,7 @@
 #!/usr/bin/env python3
+import ctypes
+import threading
+
 import grpc
 import numpy as np
 import opuslib
@@ -13,22 +16,80 @@ FRAME_MS = 20
 FRAME_SIZE = SAMPLE_RATE * FRAME_MS // 1000
 SIDECAR_ADDR = "localhost:50051"
 
+_OPUS_MAX_PACKET = 4000
+
+
+def _make_opus_encoder():
+    """Build a frame encoder that reuses one preallocated output buffer.
+
+    The high-level Encoder.encode path costs three allocations per 20 ms
+    frame: tobytes() on the input, a fresh ctypes scratch, and the sliced
+    result. Calling opus_encode directly reads int16 samples straight from
+    the numpy frame and writes into a reused buffer, leaving only the
+    exact-size bytes for the protobuf. Falls back to the high-level API if
+    the opuslib internals ever move.
+    """
+    try:
+        from opuslib.api import encoder as opus_api
+
+        state = opus_api.create_state(SAMPLE_RATE, CHANNELS, opuslib.APPLICATION_VOIP)
+        out_buf = ctypes.create_string_buffer(_OPUS_MAX_PACKET)
+        int16_ptr = ctypes.POINTER(ctypes.c_int16)
+        opus_encode = opus_api.libopus.opus_encode
+
+        def encode_frame(frame: np.ndarray) -> bytes:
+            n = opus_encode(
+                state, frame.ctypes.data_as(int16_ptr), FRAME_SIZE, out_buf, _OPUS_MAX_PACKET
+            )
+            if n < 0:
+                raise opuslib.OpusError(n)
+            return ctypes.string_at(out_buf, n)
+
+        return encode_frame
+    except (AttributeError, ImportError) as e:
+        print(f"[warn] low-level opus encode unavailable ({e}), using opuslib.Encoder", flush=True)
+        encoder = opuslib.Encoder(SAMPLE_RATE, CHANNELS, opuslib.APPLICATION_VOIP)
+
+        def encode_frame(frame: np.ndarray) -> bytes:
+            return encoder.encode(frame.tobytes(), FRAME_SIZE)
+
+        return encode_frame
+
 
 def main():
-    encoder = opuslib.Encoder(SAMPLE_RATE, CHANNELS, opuslib.APPLICATION_VOIP)
+    encode_frame = _make_opus_encoder()
 
     channel = grpc.insecure_channel(SIDECAR_ADDR)
     stub = stt_pb2_grpc.TranscriptionServiceStub(channel)
 
-    audio_queue = []
+    # SPSC ring of preallocated frames: indata.copy() allocated a fresh
+    # array inside the realtime PortAudio callback every block. The
+    # callback only writes into its slot and bumps write_idx; the consumer
+    # owns read_idx — single writer per index, so the GIL is enough.
+    # The event lets the generator sleep instead of spinning a core.
+    RING_SLOTS = 64
+    ring = [np.empty((FRAME_SIZE, CHANNELS), dtype=np.float32) for _ in range(RING_SLOTS)]
+    ring_len = [0] * RING_SLOTS
+    write_idx = 0
+    read_idx = 0
+    audio_ready = threading.Event()
     running = True
 
     def audio_callback(indata, frames, time_info, status):
+        nonlocal write_idx
         if status:
             print(f"[status] {status}", flush=True)
-        audio_queue.append(indata.copy())
+        if write_idx - read_idx >= RING_SLOTS:
+            return  # consumer stalled; drop rather than allocate or block
+        slot = write_idx % RING_SLOTS
+        n = min(frames, FRAME_SIZE)
+        np.copyto(ring[slot][:n], indata[:n])
+        ring_len[slot] = n
+        write_idx += 1
+        audio_ready.set()
 
     def message_generator():
+        nonlocal read_idx
         yield stt_pb2.ClientMessage(
             config=stt_pb2.SessionConfig(
                 language="en",
@@ -37,22 +98,38 @@ def main():
             )
         )
 
-        pcm_buffer = np.array([], dtype=np.int16)
+        # Preallocated accumulation buffer: appending with np.concatenate
+        # reallocates and copies everything accumulated so far on every
+        # callback. The float scratch lets the scale+round run without
+        # temporaries; the int16 cast happens on the slice assignment.
+        pcm_buffer = np.empty(FRAME_SIZE * 8, dtype=np.int16)
+        scratch = np.empty(FRAME_SIZE * 8, dtype=np.float32)
+        filled = 0
 
         print("Listening... (Ctrl+C to stop)", flush=True)
         while running:
-            if not audio_queue:
+            if read_idx >= write_idx:
+                audio_ready.wait(timeout=0.1)
+                audio_ready.clear()
                 continue
 
-            chunk = audio_queue.pop(0)
-            samples = (chunk[:, 0] * 32767).astype(np.int16)
-            pcm_buffer = np.concatenate([pcm_buffer, samples])
+            slot = read_idx % RING_SLOTS
+            chunk = ring[slot][:ring_len[slot]]
+            n = chunk.shape[0]
+            if filled + n > pcm_buffer.shape[0]:
+                filled = 0  # overrun; drop stale audio rather than grow
+            np.multiply(chunk[:, 0], 32767.0, out=scratch[:n])
+            np.rint(scratch[:n], out=scratch[:n])
+            pcm_buffer[filled:filled + n] = scratch[:n]
+            filled += n
+            read_idx += 1  # slot contents consumed; hand it back to the callback
 
-            while len(pcm_buffer) >= FRAME_SIZE:
-                frame_samples = pcm_buffer[:FRAME_SIZE]
-                pcm_buffer = pcm_buffer[FRAME_SIZE:]
+            start = 0
+            while filled - start >= FRAME_SIZE:
+                frame_samples = pcm_buffer[start:start + FRAME_SIZE]
+                start += FRAME_SIZE
 
-                opus_data = encoder.encode(frame_samples.tobytes(), FRAME_SIZE)
+                opus_data = encode_frame(frame_samples)
 
                 yield stt_pb2.ClientMessage(
                     opus_frame=stt_pb2.OpusFrame(
@@ -62,6 +139,12 @@ def main():
                     )
                 )
 
+            if start:
+                remaining = filled - start
+                if remaining:
+                    np.copyto(pcm_buffer[:remaining], pcm_buffer[start:filled])
+                filled = remaining
+
     print(f"Connecting to sidecar at {SIDECAR_ADDR}...", flush=True)
 
     with sd.InputStream(
@@ -64,8 +64,20 @@ def main():
 
     if audio_chunks:
         print(f"\nPlaying audio ({total_duration_ms}ms)...", flush=True)
-        pcm_data = b"".join(audio_chunks)
-        audio = np.frombuffer(pcm_data, dtype=np.int16).astype(np.float32) / 32768.0
+        # One preallocated output filled chunk by chunk: joining the bytes
+        # and then casting would pass over the full PCM three times and
+        # peak at double the memory for long syntheses.
+        total_samples = sum(len(c) // 2 for c in audio_chunks)
+        audio = np.empty(total_samples, dtype=np.float32)
+        offset = 0
+        for chunk_bytes in audio_chunks:
+            n = len(chunk_bytes) // 2
+            np.multiply(
+                np.frombuffer(chunk_bytes, dtype=np.int16),
+                np.float32(1.0 / 32768.0),
+                out=audio[offset:offset + n],
+            )
+            offset += n
         sd.play(audio, SAMPLE_RATE)
         sd.wait()
         print("Done!", flush=True)
@@ -11,6 +11,7 @@ from sidecar.audio.preprocessing import (
     AudioChunk,
     _detect_format,
     chunk_audio,
+    clear_preprocess_cache,
     decode_audio,
     preprocess_audio,
 )
@@ -70,7 +71,7 @@ class TestDecodeAudio:
             mock_audio = MagicMock()
             mock_audio.set_frame_rate.return_value = mock_audio
             mock_audio.set_channels.return_value = mock_audio
-            mock_audio.get_array_of_samples.return_value = np.array([0, 100, -100], dtype=np.int16)
+            mock_audio.raw_data = np.array([0, 100, -100], dtype=np.int16).tobytes()
             mock_from_file.return_value = mock_audio
 
             result = decode_audio(b"fake audio", "mp3")
@@ -85,7 +86,7 @@ class TestDecodeAudio:
             mock_audio = MagicMock()
             mock_audio.set_frame_rate.return_value = mock_audio
             mock_audio.set_channels.return_value = mock_audio
-            mock_audio.get_array_of_samples.return_value = np.array([0, 100, -100], dtype=np.int16)
+            mock_audio.raw_data = np.array([0, 100, -100], dtype=np.int16).tobytes()
             mock_from_file.return_value = mock_audio
 
             result = decode_audio(b"fake audio", None)
@@ -141,6 +142,14 @@ class TestChunkAudio:
 
         assert chunks[0].sample_rate == 24000
 
+    def test_chunks_are_views_not_copies(self):
+        audio = np.zeros(TARGET_SAMPLE_RATE * 60 * 12, dtype=np.float32)
+
+        chunks = chunk_audio(audio)
+
+        for chunk in chunks:
+            assert chunk.data.base is audio
+
     def test_custom_chunk_duration(self):
         audio = np.zeros(TARGET_SAMPLE_RATE * 60 * 2, dtype=np.float32)
 
@@ -165,7 +174,7 @@ class TestPreprocessAudio:
 
                 chunks = preprocess_audio(b"audio data", "test.mp3")
 
-                mock_decode.assert_called_once_with(b"audio data", "mp3")
+                mock_decode.assert_called_once_with(b"audio data", "mp3", dtype=np.float32)
                 assert len(chunks) == 1
 
     def test_preprocess_without_filename(self):
@@ -183,7 +192,21 @@ class TestPreprocessAudio:
 
                 chunks = preprocess_audio(b"audio data")
 
-                mock_decode.assert_called_once_with(b"audio data", None)
+                mock_decode.assert_called_once_with(b"audio data", None, dtype=np.float32)
+
+    def test_repeat_upload_hits_cache(self):
+        clear_preprocess_cache()
+        try:
+            with patch("sidecar.audio.preprocessing.decode_audio") as mock_decode:
+                mock_decode.return_value = np.zeros(TARGET_SAMPLE_RATE * 60, dtype=np.float32)
+
+                first = preprocess_audio(b"repeated audio", "test.wav")
+                second = preprocess_audio(b"repeated audio", "test.wav")
+
+                mock_decode.assert_called_once()
+                assert second is first
+        finally:
+            clear_preprocess_cache()
 
 
 class TestAudioChunk:
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from sidecar.stt import engine_manager
 from sidecar.stt.engine_manager import (
     MAX_OOM_RETRIES,
     EngineConfig,
@@ -42,28 +43,43 @@ class TestClearCudaCache:
         mock_torch = MagicMock()
         mock_torch.cuda.is_available.return_value = True
 
-        with patch.dict("sys.modules", {"torch": mock_torch}):
-            _clear_cuda_cache()
+        with patch.object(engine_manager, "_cuda_ok", None):
+            with patch.dict("sys.modules", {"torch": mock_torch}):
+                _clear_cuda_cache()
 
-        mock_torch.cuda.empty_cache.assert_called_once()
-        mock_torch.cuda.synchronize.assert_called_once()
+            mock_torch.cuda.empty_cache.assert_called_once()
+            mock_torch.cuda.synchronize.assert_called_once()
 
     def test_clear_without_cuda(self):
         mock_torch = MagicMock()
         mock_torch.cuda.is_available.return_value = False
 
-        with patch.dict("sys.modules", {"torch": mock_torch}):
-            _clear_cuda_cache()
+        with patch.object(engine_manager, "_cuda_ok", None):
+            with patch.dict("sys.modules", {"torch": mock_torch}):
+                _clear_cuda_cache()
 
-        mock_torch.cuda.empty_cache.assert_not_called()
+            mock_torch.cuda.empty_cache.assert_not_called()
 
     def test_clear_without_torch(self):
-        with patch.dict("sys.modules", {"torch": None}):
-            with patch("sidecar.stt.engine_manager.gc.collect") as mock_gc:
-                try:
-                    _clear_cuda_cache()
-                except (ImportError, TypeError):
-                    pass
+        with patch.object(engine_manager, "_cuda_ok", None):
+            with patch.dict("sys.modules", {"torch": None}):
+                with patch("sidecar.stt.engine_manager.gc.collect") as mock_gc:
+                    try:
+                        _clear_cuda_cache()
+                    except (ImportError, TypeError):
+                        pass
+
+    def test_probe_result_is_cached(self):
+        mock_torch = MagicMock()
+        mock_torch.cuda.is_available.return_value = True
+
+        with patch.object(engine_manager, "_cuda_ok", None):
+            with patch.dict("sys.modules", {"torch": mock_torch}):
+                _clear_cuda_cache()
+                _clear_cuda_cache()
+
+            mock_torch.cuda.is_available.assert_called_once()
+            assert mock_torch.cuda.empty_cache.call_count == 2
 
 
 class TestManagedEngine:
@@ -309,6 +325,28 @@ class TestSTTEngineManager:
             assert "test-model" in manager.engines
             assert manager.engines["test-model"].engine is not None
 
+    def test_preload_fallbacks_warms_all_models(self):
+        config = EngineConfig(
+            model_id="test-model",
+            device="cpu",
+            ttl=-1,
+            fallback_models=["fallback-1"],
+            preload_fallbacks=True,
+        )
+        manager = STTEngineManager(config)
+
+        with patch.object(manager, "_create_engine") as mock_create:
+            mock_create.return_value = MagicMock()
+            manager.preload()
+
+            for _ in range(50):
+                if "fallback-1" in manager.engines and manager.engines["fallback-1"].engine:
+                    break
+                time.sleep(0.05)
+
+            assert manager.engines["test-model"].engine is not None
+            assert manager.engines["fallback-1"].engine is not None
+
     def test_get_engine_with_retry_success(self):
         config = EngineConfig(model_id="test-model", device="cpu", ttl=-1)
         manager = STTEngineManager(config)
@@ -8,7 +8,11 @@ import pytest
 from sidecar.domain.exceptions import TranscriptionError
 from sidecar.domain.transcript_processor import deduplicate_words, merge_transcripts
 from sidecar.domain.types import Transcript
-from sidecar.infrastructure.codecs.audio_codec import pcm16_to_float32, resample_audio
+from sidecar.infrastructure.codecs.audio_codec import (
+    StreamingResampler,
+    pcm16_to_float32,
+    resample_audio,
+)
 
 
 class TestPcm16ToFloat32:
@@ -75,6 +79,24 @@ class TestResampleAudio:
             mock_resample.assert_called_once()
 
 
+class TestStreamingResampler:
+    def test_same_rate_passthrough(self):
+        audio = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+        resampler = StreamingResampler(16000, 16000)
+
+        result = resampler.process(audio)
+
+        assert result is audio
+
+    def test_downsamples_across_chunks(self):
+        resampler = StreamingResampler(48000, 16000)
+        chunks = [np.zeros(960, dtype=np.float32) for _ in range(10)]
+
+        total = sum(len(resampler.process(chunk)) for chunk in chunks)
+
+        assert 0 < total <= 10 * 960 // 3
+
+
 class TestDeduplicateWords:
     def test_no_overlap_all_new(self):
         text = "hello world"
@@ -68,6 +68,15 @@ class TestIsOomError:
         error = RuntimeError("onnxruntime session error")
         assert is_oom_error(error) is False
 
+    def test_torch_typed_oom_matched_without_keyword(self):
+        class FakeOutOfMemoryError(Exception):
+            pass
+
+        torch_mod = MagicMock()
+        torch_mod.cuda.OutOfMemoryError = FakeOutOfMemoryError
+        with patch.dict("sys.modules", {"torch": torch_mod}):
+            assert is_oom_error(FakeOutOfMemoryError("CUBLAS_STATUS_EXECUTION_FAILED")) is True
+
 
 class TestChunkText:
     def test_short_text_returns_single_chunk(self):
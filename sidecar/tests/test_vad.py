@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import numpy as np
+
+from sidecar.domain.types import SpeechStarted, SpeechStopped
+from sidecar.stt.vad import (
+    _VAD_FRAME_SAMPLES,
+    MAX_BUFFER_SAMPLES,
+    SAMPLE_RATE,
+    VADProcessor,
+    _ms_to_samples,
+)
+
+
+class _FakeScorer:
+    """Stands in for _StreamingScorer with a controllable probability.
+
+    Mirrors the real scorer's frame accounting (one probability per
+    completed 512-sample frame, partial frames carried to the next call)
+    without loading the Silero model.
+    """
+
+    def __init__(self) -> None:
+        self.prob = 0.0
+        self._pending_n = 0
+
+    def score(self, audio: np.ndarray, silent: bool = False) -> list[float]:
+        total = self._pending_n + audio.shape[0]
+        frames, self._pending_n = divmod(total, _VAD_FRAME_SAMPLES)
+        return [0.0 if silent else self.prob] * frames
+
+    def reset(self) -> None:
+        self._pending_n = 0
+
+
+def _run_session(pre_speech_s: int) -> tuple[SpeechStarted | None, SpeechStopped | None, object]:
+    """Feed pre_speech_s seconds of silence, ~2 s of speech, then silence."""
+    processor = VADProcessor()
+    scorer = _FakeScorer()
+    processor._scorer = scorer
+
+    silence = np.zeros(SAMPLE_RATE, dtype=np.float32)
+    for _ in range(pre_speech_s):
+        event, segment = processor.append(silence)
+        assert event is None and segment is None
+
+    scorer.prob = 0.9
+    speech = np.full(SAMPLE_RATE, 0.5, dtype=np.float32)
+    started = None
+    for _ in range(2):
+        event, _ = processor.append(speech)
+        if isinstance(event, SpeechStarted):
+            started = event
+
+    scorer.prob = 0.0
+    stopped = final_segment = None
+    for _ in range(3):
+        event, segment = processor.append(silence)
+        if isinstance(event, SpeechStopped):
+            stopped, final_segment = event, segment
+            break
+    return started, stopped, final_segment
+
+
+class TestVADProcessorEviction:
+    def test_segment_survives_pre_speech_longer_than_ring(self):
+        # 25 s of pre-speech audio exceeds the ring's 19 s capacity, so the
+        # oldest samples are evicted before speech starts. The stream-timeline
+        # offsets must be rebased onto the buffer at extraction; the original
+        # incremental rewrite skipped that and returned an empty slice, so
+        # the utterance was dropped as "too short".
+        pre_speech_s = 25
+        assert pre_speech_s * SAMPLE_RATE > MAX_BUFFER_SAMPLES
+
+        started, stopped, segment = _run_session(pre_speech_s)
+
+        assert started is not None
+        assert started.timestamp_ms >= (pre_speech_s - 1) * 1000
+        assert stopped is not None
+        assert segment is not None
+        assert segment.audio.size == _ms_to_samples(segment.end_ms - segment.start_ms)
+        # The slice must contain the actual speech, not evicted silence.
+        assert float(np.max(np.abs(segment.audio))) == 0.5
+
+    def test_segment_with_short_pre_speech(self):
+        # Control case: everything fits in the ring, no rebasing needed.
+        started, stopped, segment = _run_session(5)
+
+        assert started is not None
+        assert stopped is not None
+        assert segment is not None
+        assert segment.audio.size == _ms_to_samples(segment.end_ms - segment.start_ms)
+        assert float(np.max(np.abs(segment.audio))) == 0.5